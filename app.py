@@ -1,123 +1,134 @@
-import uuid
 import os
+import sys
 import warnings
-import json
 import re
+import secrets
+import hashlib
+from collections import Counter
+from itertools import chain
+from operator import itemgetter
+from types import SimpleNamespace
+import orjson
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from pydantic import BaseModel, Field, model_validator
-from typing_extensions import Self
-from typing import List, Union, Dict, Optional
-from streamlit_markmap import markmap
-
-# Keep the existing Pydantic models for compatibility
-class AuditSubNode(BaseModel):
-    sub_title: str = Field(description="3-5 words describing this specific aspect")
-    sub_content: str = Field(description="Brief specific point (max 40 words)")
-
-class AuditInsightNode(BaseModel):
-    node_title: str = Field(description="5-7 words describing the audit insight", max_length=50)
-    sub_nodes: List[AuditSubNode] = Field(description="2-4 specific sub-aspects of this insight", min_items=2, max_items=4)
-
-class ProcessedAuditDocument(BaseModel):
+from typing import List, Union, Dict, Optional, TypedDict
+
+# Shapes of the audit data built by parse_markdown_to_audit_data. These are
+# TypedDicts (plain dicts at runtime) so the static-load path pays nothing for them.
+class AuditSubNode(TypedDict):
+    sub_title: str  # 3-5 words describing this specific aspect
+    sub_content: str  # Brief specific point (max 40 words)
+
+class AuditInsightNode(TypedDict):
+    node_title: str  # 5-7 words describing the audit insight
+    sub_nodes: List[AuditSubNode]  # 2-4 specific sub-aspects of this insight
+
+class ProcessedAuditDocument(TypedDict):
     document_id: str
     document_title: str
     document_type: str
-    audit_insights: List[AuditInsightNode] = Field(description="3-6 most important audit insights from this document")
+    audit_insights: List[AuditInsightNode]  # 3-6 most important audit insights from this document
 
-class UnifiedAuditMindMap(BaseModel):
-    unified_title: str = Field(description="5-7 words summarizing the audit scope of all documents")
-    audit_context: str = Field(description="Brief description of what this collection tells auditors")
-    documents: List[ProcessedAuditDocument] = Field(description="All processed documents with audit insights")
-    
-    @model_validator(mode="after")
-    def validate_audit_structure(self) -> Self:
-        if not self.documents:
-            raise ValueError("Must have at least one document")
-        if len(self.unified_title.split()) > 7:
-            raise ValueError("Unified title must be 5-7 words maximum")
-        return self
+class UnifiedAuditMindMap(TypedDict):
+    unified_title: str  # 5-7 words summarizing the audit scope of all documents
+    audit_context: str  # Brief description of what this collection tells auditors
+    documents: List[ProcessedAuditDocument]  # All processed documents with audit insights
 
 class AuditMindMapWarning(Warning):
     """Warning for audit mind map generation failures"""
 
 # MODIFIED FUNCTIONS TO USE STATIC MARKDOWN FILE
 
+# The spinner only shows on a cache miss; repeat loads return without any UI chrome
+@st.cache_resource(show_spinner="📂 Loading static mind map...")
 def load_static_mindmap() -> tuple:
-    """Load the pre-saved mindmap markdown file"""
+    """Load the pre-saved mindmap markdown file (once per process, shared read-only)"""
     mindmap_file = "mindmap_5038c8c4.md"
     
     try:
         # Read the markdown content
-        with open(mindmap_file, 'r', encoding='utf-8') as file:
-            markdown_content = file.read()
+        with open(mindmap_file, 'rb') as file:
+            markdown_content = file.read().decode('utf-8')
         
         # Create mock audit data structure based on the markdown content
         audit_data = parse_markdown_to_audit_data(markdown_content)
         
-        return markdown_content, audit_data
+        return markdown_content, audit_data, compute_mindmap_stats(markdown_content, audit_data)
         
     except FileNotFoundError:
         # Fallback with the provided content if file not found
         markdown_content = """"""
         
         audit_data = parse_markdown_to_audit_data(markdown_content)
-        return markdown_content, audit_data
+        return markdown_content, audit_data, compute_mindmap_stats(markdown_content, audit_data)
+
+# One heading line of the static mind map: "#..#### <emoji> text" or "##### text"
+_HEADING_RE = re.compile(
+    r'^[^\S\n]*(?:#####[^\S\n]|(#{1,4})[^\S\n]+(🔍|📋|🎯|🔸))[^\S\n]*(.*?)[^\S\n]*$',
+    re.MULTILINE
+)
+
+# (heading hashes, emoji marker) -> node kind; "#####" content lines match neither group
+_HEADING_KINDS = {
+    ('#', '🔍'): 'title',
+    ('##', '📋'): 'document',
+    ('###', '🎯'): 'insight',
+    ('####', '🔸'): 'sub_title',
+    (None, None): 'sub_content',
+}
 
-def parse_markdown_to_audit_data(markdown_content: str) -> Dict:
+@st.cache_data(show_spinner=False)
+def parse_markdown_to_audit_data(markdown_content: str) -> UnifiedAuditMindMap:
     """Parse markdown content into audit data structure"""
-    lines = markdown_content.split('\n')
+    unified_title = None
     
-    # Extract title
-    unified_title = "Integrated Controls Framework Overview"
-    for line in lines:
-        if line.startswith('# 🔍'):
-            unified_title = line.replace('# 🔍', '').strip()
-            break
-    
-    # Parse documents and insights
+    # Parse title, documents and insights in a single pass
     documents = []
     current_doc = None
     current_insight = None
     
-    for line in lines:
-        line = line.strip()
-        if line.startswith('## 📋'):
+    for match in _HEADING_RE.finditer(markdown_content):
+        hashes, marker, text = match.groups()
+        kind = _HEADING_KINDS.get((hashes, marker))
+        
+        if kind is None:
+            continue
+        
+        elif kind == 'title':
+            # Extract title (first one wins)
+            if unified_title is None:
+                unified_title = text
+        
+        elif kind == 'document':
             # New document
             if current_doc:
                 documents.append(current_doc)
             current_doc = {
-                "document_id": str(uuid.uuid4())[:8],
-                "document_title": line.replace('## 📋', '').strip(),
+                "document_id": "",  # filled in below once the documents are counted
+                "document_title": text,
                 "document_type": "Policy Document",
                 "audit_insights": []
             }
             
-        elif line.startswith('### 🎯'):
+        elif kind == 'insight':
             # New insight
             if current_insight and current_doc:
                 current_doc["audit_insights"].append(current_insight)
             current_insight = {
-                "node_title": line.replace('### 🎯', '').strip(),
+                "node_title": text,
                 "sub_nodes": []
             }
             
-        elif line.startswith('#### 🔸'):
+        elif kind == 'sub_title':
             # Sub node title
             if current_insight:
-                sub_title = line.replace('#### 🔸', '').strip()
                 current_insight["sub_nodes"].append({
-                    "sub_title": sub_title,
+                    "sub_title": text,
                     "sub_content": ""
                 })
                 
-        elif line.startswith('##### ') and current_insight and current_insight["sub_nodes"]:
+        elif current_insight and current_insight["sub_nodes"]:
             # Sub node content
-            content = line.replace('#####', '').strip()
-            current_insight["sub_nodes"][-1]["sub_content"] = content
+            current_insight["sub_nodes"][-1]["sub_content"] = text
     
     # Add last insight and document
     if current_insight and current_doc:
@@ -125,223 +136,278 @@ def parse_markdown_to_audit_data(markdown_content: str) -> Dict:
     if current_doc:
         documents.append(current_doc)
     
+    # Draw random bytes for every document id in one call (8 hex chars each)
+    document_ids = secrets.token_hex(4 * len(documents))
+    for index, doc in enumerate(documents):
+        doc["document_id"] = document_ids[8 * index:8 * index + 8]
+    
     return {
-        "unified_title": unified_title,
+        "unified_title": unified_title or "Integrated Controls Framework Overview",
         "audit_context": "Comprehensive framework covering security, data governance, risk management and audit controls",
         "documents": documents
     }
 
+def compute_mindmap_stats(markdown_content: str, audit_data: Dict) -> Dict:
+    """Count the documents, insights, controls and words shown in the mind map stats"""
+    # Count insights and controls in one traversal
+    documents = audit_data.get("documents", ())
+    total_insights = 0
+    total_subnodes = 0
+    for doc in documents:
+        insights = doc.get("audit_insights", ())
+        total_insights += len(insights)
+        for insight in insights:
+            total_subnodes += len(insight.get("sub_nodes", ()))
+    
+    return {
+        "documents": len(documents),
+        "insights": total_insights,
+        "controls": total_subnodes,
+        "words": len(markdown_content.split()),
+    }
+
 def generate_audit_mindmap(documents: List[Dict] = None) -> Union[tuple, tuple]:
     """Generate audit-focused mind map using static markdown file"""
     try:
         # Ignore the documents parameter and use static content
-        markdown_content, audit_data = load_static_mindmap()
-        return markdown_content, audit_data
+        markdown_content, audit_data, mindmap_stats = load_static_mindmap()
+        return markdown_content, audit_data, mindmap_stats
         
     except Exception as e:
         warnings.warn(
             message=f"Static mind map loading failed: {e}",
             category=AuditMindMapWarning,
         )
-        return None, None
+        return None, None, None
 
-def show_fullscreen_mindmap(mindmap_content: str, audit_data: Dict):
-    """Display fullscreen mind map modal similar to NotebookLM"""
-    
-    # Modal CSS styling
-    st.markdown("""
-    <style>
-    .mindmap-modal {
-        position: fixed;
-        z-index: 999999;
-        left: 0;
-        top: 0;
-        width: 100%;
-        height: 100%;
-        background-color: rgba(0,0,0,0.8);
-        display: flex;
-        justify-content: center;
-        align-items: center;
-    }
-    
-    .mindmap-modal-content {
-        background-color: #ffffff;
-        width: 95vw;
-        height: 95vh;
-        border-radius: 12px;
-        position: relative;
-        display: flex;
-        flex-direction: column;
-        box-shadow: 0 10px 30px rgba(0,0,0,0.3);
-    }
-    
-    .mindmap-header {
-        background: linear-gradient(90deg, #1e3c72 0%, #2a5298 100%);
-        color: white;
-        padding: 1rem 2rem;
-        border-radius: 12px 12px 0 0;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        font-size: 1.2rem;
-        font-weight: bold;
-    }
-    
-    .mindmap-body {
-        flex: 1;
-        padding: 1rem;
-        overflow: auto;
-        background: #f8f9fa;
-    }
-    
-    .close-btn {
-        background: rgba(255,255,255,0.2);
-        border: 1px solid rgba(255,255,255,0.3);
-        color: white;
-        padding: 0.5rem 1rem;
-        border-radius: 6px;
-        cursor: pointer;
-        font-size: 1rem;
-        transition: all 0.3s ease;
-    }
-    
-    .close-btn:hover {
-        background: rgba(255,255,255,0.3);
-        border-color: rgba(255,255,255,0.5);
-    }
+@st.cache_data(show_spinner=False)
+def audit_data_to_json(markdown_content: str) -> bytes:
+    """Serialize the audit data parsed from the mind map markdown as indented JSON"""
+    # Keyed on the markdown string (cheap to hash) rather than the nested audit dict;
+    # the parse itself is cached, so this yields the same document ids as the loader
+    return orjson.dumps(parse_markdown_to_audit_data(markdown_content), option=orjson.OPT_INDENT_2)
+
+def content_suffix(content: Union[str, bytes]) -> str:
+    """Short content hash used to keep download filenames stable across reruns"""
+    if isinstance(content, str):
+        content = content.encode()
+    return hashlib.blake2b(content, digest_size=4).hexdigest()
+
+# Modal CSS styling for the fullscreen mind map (built once at import)
+_FULLSCREEN_CSS = """
+<style>
+.mindmap-modal {
+    position: fixed;
+    z-index: 999999;
+    left: 0;
+    top: 0;
+    width: 100%;
+    height: 100%;
+    background-color: rgba(0,0,0,0.8);
+    display: flex;
+    justify-content: center;
+    align-items: center;
+}
+
+.mindmap-modal-content {
+    background-color: #ffffff;
+    width: 95vw;
+    height: 95vh;
+    border-radius: 12px;
+    position: relative;
+    display: flex;
+    flex-direction: column;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.3);
+}
+
+.mindmap-header {
+    background: linear-gradient(90deg, #1e3c72 0%, #2a5298 100%);
+    color: white;
+    padding: 1rem 2rem;
+    border-radius: 12px 12px 0 0;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    font-size: 1.2rem;
+    font-weight: bold;
+}
+
+.mindmap-body {
+    flex: 1;
+    padding: 1rem;
+    overflow: auto;
+    background: #f8f9fa;
+}
+
+.close-btn {
+    background: rgba(255,255,255,0.2);
+    border: 1px solid rgba(255,255,255,0.3);
+    color: white;
+    padding: 0.5rem 1rem;
+    border-radius: 6px;
+    cursor: pointer;
+    font-size: 1rem;
+    transition: all 0.3s ease;
+}
+
+.close-btn:hover {
+    background: rgba(255,255,255,0.3);
+    border-color: rgba(255,255,255,0.5);
+}
+
+.mindmap-stats {
+    display: flex;
+    gap: 2rem;
+    margin-bottom: 1rem;
+    padding: 1rem;
+    background: white;
+    border-radius: 8px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+
+.stat-item {
+    text-align: center;
+}
+
+.stat-number {
+    font-size: 2rem;
+    font-weight: bold;
+    color: #2a5298;
+    display: block;
+}
+
+.stat-label {
+    font-size: 0.9rem;
+    color: #666;
+    margin-top: 0.25rem;
+}
+
+.mindmap-container-fullscreen {
+    background: white;
+    border-radius: 8px;
+    height: calc(100% - 150px);
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    overflow: hidden;
+}
+</style>
+"""
+
+@st.cache_data(show_spinner=False)
+def _fullscreen_header_html(title: str, context: str, documents: int, insights: int, controls: int, words: int) -> str:
+    """Render the fullscreen header and statistics bar as one HTML block"""
+    return f"""
+    <div class="mindmap-header">
+        <div>
+            <span>🧠 {title}</span>
+            <div style="font-size: 0.9rem; font-weight: normal; margin-top: 0.25rem; opacity: 0.9;">
+                {context}
+            </div>
+        </div>
+    </div>
+    <div class="mindmap-stats">
+        <div class="stat-item">
+            <span class="stat-number">{documents}</span>
+            <div class="stat-label">Documents</div>
+        </div>
+        <div class="stat-item">
+            <span class="stat-number">{insights}</span>
+            <div class="stat-label">Insights</div>
+        </div>
+        <div class="stat-item">
+            <span class="stat-number">{controls}</span>
+            <div class="stat-label">Controls</div>
+        </div>
+        <div class="stat-item">
+            <span class="stat-number">{words}</span>
+            <div class="stat-label">Words</div>
+        </div>
+    </div>
+    """
+
+@st.fragment
+def _fullscreen_actions(mindmap_content: str):
+    """Download, regenerate and close buttons under the fullscreen mind map"""
+    col1, col2, col3, col4 = st.columns([1, 1, 1, 2])
     
-    .mindmap-stats {
-        display: flex;
-        gap: 2rem;
-        margin-bottom: 1rem;
-        padding: 1rem;
-        background: white;
-        border-radius: 8px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
+    with col1:
+        st.download_button(
+            "💾 Download MD",
+            mindmap_content,
+            f"mindmap_{content_suffix(mindmap_content)}.md",
+            "text/markdown",
+            use_container_width=True
+        )
     
-    .stat-item {
-        text-align: center;
-    }
+    with col2:
+        json_bytes = audit_data_to_json(mindmap_content)
+        st.download_button(
+            "📊 Export JSON",
+            json_bytes,
+            f"mindmap_data_{content_suffix(json_bytes)}.json",
+            "application/json",
+            use_container_width=True
+        )
     
-    .stat-number {
-        font-size: 2rem;
-        font-weight: bold;
-        color: #2a5298;
-        display: block;
-    }
+    with col3:
+        if st.button("🔄 Regenerate", use_container_width=True):
+            st.session_state.mindmap_generated = False
+            st.session_state.view = "main"
+            st.rerun()
     
-    .stat-label {
-        font-size: 0.9rem;
-        color: #666;
-        margin-top: 0.25rem;
-    }
+    with col4:
+        if st.button("✖️ Close Fullscreen View", type="primary", use_container_width=True):
+            st.session_state.view = "main"
+            st.rerun()
+
+def show_fullscreen_mindmap(mindmap_content: str, audit_data: Dict, mindmap_stats: Dict):
+    """Display fullscreen mind map modal similar to NotebookLM"""
     
-    .mindmap-container-fullscreen {
-        background: white;
-        border-radius: 8px;
-        height: calc(100% - 150px);
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        overflow: hidden;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # Modal CSS styling
+    st.html(_FULLSCREEN_CSS)
     
     # Create modal container
     modal_container = st.empty()
     
     with modal_container.container():
-        # Header with title and close button
-        st.markdown(f"""
-        <div class="mindmap-header">
-            <div>
-                <span>🧠 {audit_data.get('unified_title', 'Audit Mind Map')}</span>
-                <div style="font-size: 0.9rem; font-weight: normal; margin-top: 0.25rem; opacity: 0.9;">
-                    {audit_data.get('audit_context', 'Interactive document analysis')}
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Statistics section
-        total_insights = sum(len(doc.get("audit_insights", [])) for doc in audit_data.get("documents", []))
-        total_subnodes = sum(
-            len(insight.get("sub_nodes", [])) 
-            for doc in audit_data.get("documents", []) 
-            for insight in doc.get("audit_insights", [])
-        )
-        
-        st.markdown(f"""
-        <div class="mindmap-stats">
-            <div class="stat-item">
-                <span class="stat-number">{len(audit_data.get("documents", []))}</span>
-                <div class="stat-label">Documents</div>
-            </div>
-            <div class="stat-item">
-                <span class="stat-number">{total_insights}</span>
-                <div class="stat-label">Insights</div>
-            </div>
-            <div class="stat-item">
-                <span class="stat-number">{total_subnodes}</span>
-                <div class="stat-label">Controls</div>
-            </div>
-            <div class="stat-item">
-                <span class="stat-number">{len(mindmap_content.split())}</span>
-                <div class="stat-label">Words</div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        # Header and statistics (stats precomputed when the mind map was loaded)
+        st.html(_fullscreen_header_html(
+            audit_data.get('unified_title', 'Audit Mind Map'),
+            audit_data.get('audit_context', 'Interactive document analysis'),
+            mindmap_stats["documents"],
+            mindmap_stats["insights"],
+            mindmap_stats["controls"],
+            mindmap_stats["words"]
+        ))
         
-        # Mind map container
-        st.markdown('<div class="mindmap-container-fullscreen">', unsafe_allow_html=True)
+        # Mind map container (component imported on first render only)
+        from streamlit_markmap import markmap
+        st.html('<div class="mindmap-container-fullscreen">')
         markmap(mindmap_content, height=600)
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.html('</div>')
         
-        # Action buttons
-        col1, col2, col3, col4 = st.columns([1, 1, 1, 2])
-        
-        with col1:
-            if st.button("💾 Download", use_container_width=True):
-                st.download_button(
-                    "📥 Download MD",
-                    mindmap_content,
-                    f"mindmap_{uuid.uuid4().hex[:8]}.md",
-                    "text/markdown",
-                    use_container_width=True
-                )
-        
-        with col2:
-            if st.button("📊 Export JSON", use_container_width=True):
-                st.download_button(
-                    "📥 Download JSON",
-                    json.dumps(audit_data, indent=2),
-                    f"mindmap_data_{uuid.uuid4().hex[:8]}.json",
-                    "application/json",
-                    use_container_width=True
-                )
-        
-        with col3:
-            if st.button("🔄 Regenerate", use_container_width=True):
-                st.session_state.mindmap_generated = False
-                st.session_state.show_fullscreen = False
-                st.rerun()
-        
-        with col4:
-            if st.button("✖️ Close Fullscreen View", type="primary", use_container_width=True):
-                st.session_state.show_fullscreen = False
-                st.rerun()
+        # Action buttons (download clicks only rerun this row)
+        _fullscreen_actions(mindmap_content)
 
 # Facts Overview Functions (keeping unchanged from original)
+
+# Policy fields that are checked for conflicting values across documents
+_INCONSISTENT_KEYS = frozenset({
+    'security_training_frequency',
+    'information_security_risk_assessment_frequency',
+    'recovery_time_objective',
+    'password_minimum_length',
+})
+
+# Policy facts data file
+FACT_INDEX_FILE = "factIndex.json"
+
 def load_facts_data():
     """Load the policy data"""
-    factIndex_file = "factIndex.json"
+    factIndex_file = FACT_INDEX_FILE
     
     try:
-        # Load JSON content
-        with open(factIndex_file, 'r', encoding='utf-8') as file:
-            factIndex_content = json.load(file)
-        
-        return factIndex_content
+        # Key the cached read on the file's mtime so edits are picked up
+        mtime = os.path.getmtime(factIndex_file)
         
     except FileNotFoundError:
         # Fallback with the provided content if file not found
@@ -349,313 +415,678 @@ def load_facts_data():
         
         return factIndex_content
 
-    # sample_data = json.load(open("factIndex.json"))
-    # return sample_data
+    return _read_facts_file(factIndex_file, mtime)
+
+@st.cache_resource(show_spinner=False)
+def _read_facts_file(factIndex_file: str, mtime: float) -> Dict:
+    """Read and parse the fact index JSON (one shared, read-only copy per file version)"""
+    with open(factIndex_file, 'rb') as file:
+        factIndex_content = orjson.loads(file.read())
+    
+    return _normalize_facts(factIndex_content)
+
+@st.cache_data(show_spinner=False)
+def parse_uploaded_facts(raw: bytes) -> Dict:
+    """Parse an uploaded fact index JSON (cached per file contents)"""
+    return _normalize_facts(orjson.loads(raw))
+
+def _normalize_facts(data: Dict) -> Dict:
+    """Fill optional fact keys once at load so the render loops can subscript directly"""
+    for facts in data.values():
+        for fact in facts:
+            fact.setdefault('source_sentence', 'N/A')
+            # Share one string object per document title across all facts
+            title = fact.get('document_title')
+            if isinstance(title, str):
+                fact['document_title'] = sys.intern(title)
+    return data
 
 def categorize_facts(data):
     """Categorize facts into consistent and inconsistent"""
-    inconsistent_keys = ['security_training_frequency', 'information_security_risk_assessment_frequency', 
-                        'recovery_time_objective', 'password_minimum_length']
+    inconsistent_facts = {}
+    consistent_facts = {}
     
-    inconsistent_facts = {k: v for k, v in data.items() if k in inconsistent_keys and len(v) > 1}
-    consistent_facts = {k: v for k, v in data.items() if k not in inconsistent_keys or len(v) == 1}
+    # Partition the fields in a single pass over the data
+    for field_name, facts in data.items():
+        checked = field_name in _INCONSISTENT_KEYS
+        if checked and len(facts) > 1:
+            inconsistent_facts[field_name] = facts
+        elif not checked or len(facts) == 1:
+            consistent_facts[field_name] = facts
     
     return inconsistent_facts, consistent_facts
 
-def show_facts_overview_popup():
-    """Display Facts Overview popup with the complete policy analyzer"""
+@st.cache_data(show_spinner=False)
+def get_facts_summary(data: Dict) -> SimpleNamespace:
+    """Precompute the facts overview aggregates once per dataset"""
+    inconsistent_facts, consistent_facts = categorize_facts(data)
     
-    # Facts Overview CSS
-    st.markdown("""
-    <style>
-        .inconsistent-metric {
-            background-color: #ffebee;
-            border: 2px solid #f44336;
-            border-radius: 10px;
-            padding: 10px;
-            margin: 5px 0;
-        }
-        .consistent-metric {
-            background-color: #e8f5e8;
-            border: 2px solid #4caf50;
-            border-radius: 10px;
-            padding: 10px;
-            margin: 5px 0;
-        }
-        .fact-metric {
-            background-color: #f5f5f5;
-            border: 2px solid #9e9e9e;
-            border-radius: 10px;
-            padding: 10px;
-            margin: 5px 0;
-        }
-        .warning-box {
-            background-color: #fff3cd;
-            border: 1px solid #ffeaa7;
-            border-radius: 5px;
-            padding: 15px;
-            margin: 10px 0;
-        }
-        .info-box {
-            background-color: #e3f2fd;
-            border: 1px solid #90caf9;
-            border-radius: 5px;
-            padding: 15px;
-            margin: 10px 0;
-        }
-        .doc-badge {
-            display: inline-block;
-            padding: 3px 8px;
-            margin: 2px;
-            background-color: #e1f5fe;
-            border-radius: 15px;
-            font-size: 12px;
-            border: 1px solid #0277bd;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    # Number of conflicting facts contributed by each document; map/itemgetter/chain
+    # keep the whole counting loop in C instead of a Python generator frame
+    doc_inconsistencies = Counter(map(
+        itemgetter('document_title'),
+        chain.from_iterable(inconsistent_facts.values())
+    ))
     
-    # Header
-    st.title("🔍 Policy Document Inconsistency Analyzer")
-    st.markdown("---")
+    # Display title for every policy field, e.g. "password_minimum_length" -> "Password Minimum Length"
+    field_titles = {field_name: field_name.replace('_', ' ').title() for field_name in data}
     
-    # Load data
-    data = load_facts_data()
-    inconsistent_facts, consistent_facts = categorize_facts(data)
+    total_facts = len(data)
+    consistency_rate = (len(consistent_facts) / total_facts) * 100 if total_facts else 0
     
-    # Sidebar
-    st.sidebar.header("📊 Dashboard Controls")
+    # Full-width content fingerprint of the dataset, used to key the per-field table
+    # cache; these caches are shared across sessions, so a short suffix is not enough
+    data_key = hashlib.blake2b(orjson.dumps(data, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
     
-    # File upload option
-    uploaded_file = st.sidebar.file_uploader("Upload JSON Data", type=['json'])
-    if uploaded_file is not None:
-        data = json.load(uploaded_file)
-        inconsistent_facts, consistent_facts = categorize_facts(data)
+    return SimpleNamespace(
+        data_key=data_key,
+        inconsistent_facts=inconsistent_facts,
+        consistent_facts=consistent_facts,
+        doc_inconsistencies=doc_inconsistencies,
+        field_titles=field_titles,
+        total_facts=total_facts,
+        consistency_rate=consistency_rate,
+    )
+
+@st.cache_data(show_spinner=False)
+def _consistent_facts_html(data_key: str, _consistent_facts: Dict, _field_titles: Dict) -> str:
+    """Render every consistent fact card with its status as a single HTML grid"""
+    cards = []
+    for field_name, facts in _consistent_facts.items():
+        fact = facts[0]  # Since consistent facts have only one entry
+        source = fact['source_sentence']
+        cards.append(f"""
+        <div class="consistent-metric">
+            <h4>{_field_titles[field_name]}</h4>
+            <p><strong>Value:</strong> {fact['value']}</p>
+            <p><strong>Source:</strong> "{source[:100]}{'...' if len(source) > 100 else ''}"</p>
+            <span class="doc-badge">{fact['document_title']}</span>
+        </div>
+        <div class="consistent-status">✅ <strong>Consistent</strong></div>
+        """)
     
-    # Overview metrics
-    col1, col2, col3, col4 = st.columns(4)
+    return f'<div class="consistent-grid">{"".join(cards)}</div>'
+
+@st.cache_data(show_spinner=False)
+def _fact_table(data_key: str, field_name: str, columns: tuple, _facts: List[Dict]):
+    """Build the facts table for one policy field (cached per dataset, field and columns)"""
+    import pandas as pd
     
-    with col1:
-        st.metric(
-            label="📋 Total Objective Facts", 
-            value=len(data),
-            help="Total number of objective facts analyzed"
-        )
+    # Table column -> fact key
+    fact_keys = {
+        "Value": "value",
+        "Document": "document_title",
+        "Fact Name": "fact_name",
+        "Source Sentence": "source_sentence",
+        "Reference": "reference",
+    }
+    table = {column: [] for column in columns}
+    for fact in _facts:
+        for column in columns:
+            table[column].append(fact[fact_keys[column]])
     
-    with col2:
-        st.metric(
-            label="⚠️ Inconsistent Facts", 
-            value=len(inconsistent_facts),
-            delta=f"-{len(inconsistent_facts)} conflicts",
-            delta_color="inverse",
-            help="Fields with conflicting values across documents"
-        )
+    # Arrow-backed strings serialize to the frontend without per-cell object boxing
+    return pd.DataFrame(table, dtype="string[pyarrow]")
+
+# Fixed text schema for the fact tables so st.dataframe skips type inference
+_FACT_TABLE_COLUMN_CONFIG = {
+    column: st.column_config.TextColumn(column)
+    for column in ("Value", "Document", "Fact Name", "Source Sentence", "Reference")
+}
+
+# Facts Overview CSS (built once at import)
+_FACTS_OVERVIEW_CSS = """
+<style>
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 2px;
+    }
+    .stTabs [data-baseweb="tab"] {
+        height: 50px;
+        padding-left: 20px;
+        padding-right: 20px;
+    }
+    .inconsistent-metric {
+        background-color: #ffebee;
+        border: 2px solid #f44336;
+        border-radius: 10px;
+        padding: 10px;
+        margin: 5px 0;
+    }
+    .consistent-metric {
+        background-color: #e8f5e8;
+        border: 2px solid #4caf50;
+        border-radius: 10px;
+        padding: 10px;
+        margin: 5px 0;
+    }
+    .fact-metric {
+        background-color: #f5f5f5;
+        border: 2px solid #9e9e9e;
+        border-radius: 10px;
+        padding: 10px;
+        margin: 5px 0;
+    }
+    .warning-box {
+        background-color: #fff3cd;
+        border: 1px solid #ffeaa7;
+        border-radius: 5px;
+        padding: 15px;
+        margin: 10px 0;
+    }
+    .info-box {
+        background-color: #e3f2fd;
+        border: 1px solid #90caf9;
+        border-radius: 5px;
+        padding: 15px;
+        margin: 10px 0;
+    }
+    .doc-badge {
+        display: inline-block;
+        padding: 3px 8px;
+        margin: 2px;
+        background-color: #e1f5fe;
+        border-radius: 15px;
+        font-size: 12px;
+        border: 1px solid #0277bd;
+    }
+    .consistent-grid {
+        display: grid;
+        grid-template-columns: 3fr 1fr;
+        gap: 0 1rem;
+        align-items: center;
+    }
+    .metrics-row {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 1rem;
+        margin-bottom: 1rem;
+    }
+    .overview-metric-label {
+        font-size: 14px;
+        color: #555;
+    }
+    .overview-metric-value {
+        font-size: 2rem;
+        font-weight: bold;
+    }
+    .overview-metric-delta {
+        font-size: 14px;
+    }
+</style>
+"""
+
+@st.cache_data(show_spinner=False)
+def _render_metrics_html(total: int, inconsistent: int, consistent: int, rate: float) -> str:
+    """Render the four overview metric cards as a single HTML row"""
+    return f"""
+    <div class="metrics-row">
+        <div class="fact-metric" title="Total number of objective facts analyzed">
+            <div class="overview-metric-label">📋 Total Objective Facts</div>
+            <div class="overview-metric-value">{total}</div>
+        </div>
+        <div class="inconsistent-metric" title="Fields with conflicting values across documents">
+            <div class="overview-metric-label">⚠️ Inconsistent Facts</div>
+            <div class="overview-metric-value">{inconsistent}</div>
+            <div class="overview-metric-delta" style="color: #4caf50;">↓ -{inconsistent} conflicts</div>
+        </div>
+        <div class="consistent-metric" title="Fields with consistent values across documents">
+            <div class="overview-metric-label">✅ Consistent Facts</div>
+            <div class="overview-metric-value">{consistent}</div>
+            <div class="overview-metric-delta" style="color: #4caf50;">↑ +{consistent} aligned</div>
+        </div>
+        <div class="fact-metric" title="Percentage of consistent policy fields">
+            <div class="overview-metric-label">📈 Consistency Rate</div>
+            <div class="overview-metric-value">{rate:.1f}%</div>
+        </div>
+    </div>
+    """
+
+# Consistency pie chart labels and colors (only the counts depend on the data)
+_CONSISTENCY_STATUSES = ('Consistent', 'Inconsistent')
+_CONSISTENCY_COLORS = ('#4CAF50', '#F44336')
+
+@st.cache_data(show_spinner=False)
+def _consistency_pie_figure(statuses: tuple, counts: tuple, colors: tuple) -> Dict:
+    """Build the consistency distribution pie chart as a plotly figure dict"""
+    import plotly.graph_objects as go
     
-    with col3:
-        st.metric(
-            label="✅ Consistent Facts", 
-            value=len(consistent_facts),
-            delta=f"+{len(consistent_facts)} aligned",
-            delta_color="normal",
-            help="Fields with consistent values across documents"
-        )
+    fig = go.Figure(go.Pie(
+        labels=statuses,
+        values=counts,
+        marker_colors=colors
+    ))
+    fig.update_layout(title="Overall Policy Consistency Distribution")
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _document_inconsistency_bar_figure(doc_counts: tuple) -> Dict:
+    """Build the inconsistent-fields-by-document bar chart from (document, count) pairs"""
+    import plotly.graph_objects as go
     
-    with col4:
-        consistency_rate = (len(consistent_facts) / len(data)) * 100 if data else 0
-        st.metric(
-            label="📈 Consistency Rate", 
-            value=f"{consistency_rate:.1f}%",
-            help="Percentage of consistent policy fields"
+    documents = [doc for doc, _ in doc_counts]
+    counts = [count for _, count in doc_counts]
+    fig = go.Figure(go.Bar(
+        x=documents,
+        y=counts,
+        marker=dict(
+            color=counts,
+            colorscale='Reds',
+            showscale=True,
+            colorbar=dict(title='Inconsistent Fields')
         )
+    ))
+    fig.update_layout(
+        title="Inconsistent Fields by Document",
+        xaxis_title='Document',
+        yaxis_title='Inconsistent Fields'
+    )
+    fig.update_xaxes(tickangle=45)
+    return fig.to_dict()
+
+def load_facts_summary() -> SimpleNamespace:
+    """Load the summary of the bundled policy data without re-hashing it every rerun"""
+    try:
+        mtime = os.path.getmtime(FACT_INDEX_FILE)
+        
+    except FileNotFoundError:
+        # Fallback to an empty dataset if file not found
+        return get_facts_summary({})
+    
+    return _summarize_facts_file(FACT_INDEX_FILE, mtime)
+
+@st.cache_data(show_spinner=False)
+def _summarize_facts_file(factIndex_file: str, mtime: float) -> SimpleNamespace:
+    """Summarize the fact index file (cached per file version)"""
+    return get_facts_summary(_read_facts_file(factIndex_file, mtime))
+
+@st.cache_data(show_spinner=False)
+def facts_preview_html(total: int, consistent: int, inconsistent: int, rate: float) -> str:
+    """Studio preview metrics as a static HTML table"""
+    rows = (
+        ("Total Facts", total),
+        ("Consistent", consistent),
+        ("Inconsistencies", inconsistent),
+        ("Consistency Rate", f"{rate:.1f}%"),
+    )
+    body = "".join(f"<tr><td>{label}</td><td>{value}</td></tr>" for label, value in rows)
+    return f'<table class="facts-preview">{body}</table>'
+
+def _toggle_field(open_key: str):
+    """Flip the open/closed state of a policy field in the All Facts tab"""
+    st.session_state[open_key] = not st.session_state.get(open_key, False)
+
+@st.fragment
+def show_facts_analysis(data: Dict):
+    """Display the facts overview metrics and analysis tabs for ``data``"""
+    # The chart library is only needed once the overview is open
+    import plotly.graph_objects as go
+    
+    summary = get_facts_summary(data)
+    inconsistent_facts = summary.inconsistent_facts
+    consistent_facts = summary.consistent_facts
+    field_titles = summary.field_titles
+    
+    # Overview metrics
+    st.markdown(
+        _render_metrics_html(
+            summary.total_facts,
+            len(inconsistent_facts),
+            len(consistent_facts),
+            summary.consistency_rate
+        ),
+        unsafe_allow_html=True
+    )
     
-    # Main content tabs
-    tab1, tab2, tab3, tab4 = st.tabs(["📋 All Facts", "🚨 Inconsistencies", "✅ Consistent Facts", "📊 Analytics"])
+    # Main content tabs (only the selected tab's body runs; switching tabs reruns this fragment)
+    tab1, tab2, tab3, tab4 = st.tabs(
+        ["📋 All Facts", "🚨 Inconsistencies", "✅ Consistent Facts", "📊 Analytics"],
+        key="facts_tab",
+        on_change="rerun"
+    )
     
     with tab1:
-        st.header("📋 All Objective Facts Overview")
+        if tab1.open:
+            st.header("📋 All Objective Facts Overview")
         
-        if not data:
-            st.warning("No data available to display.")
-        else:
-            st.markdown("""
-            <div class="info-box">
-                <strong>📋 Complete Facts Inventory:</strong> This section displays all objective facts extracted from your policy documents, 
-                organized by policy field. Each fact includes its value, source document, source sentence, context, and reference information.
-            </div>
-            """, unsafe_allow_html=True)
+            if not data:
+                st.warning("No data available to display.")
+            else:
+                st.markdown("""
+                <div class="info-box">
+                    <strong>📋 Complete Facts Inventory:</strong> This section displays all objective facts extracted from your policy documents, 
+                    organized by policy field. Each fact includes its value, source document, source sentence, context, and reference information.
+                </div>
+                """, unsafe_allow_html=True)
             
-            # Display all facts organized by policy field
-            for idx, (field_name, facts) in enumerate(data.items(), 1):
-                # Determine if this field is consistent or inconsistent
-                status = "Inconsistent" if len(facts) > 1 and field_name in ['security_training_frequency', 'information_security_risk_assessment_frequency', 'recovery_time_objective', 'password_minimum_length'] else "Consistent"
-                status_emoji = "⚠️" if status == "Inconsistent" else "✅"
+                # Display all facts organized by policy field
+                for idx, (field_name, facts) in enumerate(data.items(), 1):
+                    # Determine if this field is consistent or inconsistent
+                    status = "Inconsistent" if field_name in inconsistent_facts else "Consistent"
+                    status_emoji = "⚠️" if status == "Inconsistent" else "✅"
                 
-                fact_name = facts[0]["fact_name"]
-                if not fact_name:
-                    fact_name = field_name.replace('_', ' ').title()
+                    # Only the fields the user has opened pay for building their table
+                    open_key = f"open_{field_name}"
+                    st.button(
+                        f"{status_emoji} {field_titles[field_name]} ({len(facts)} fact{'s' if len(facts) > 1 else ''})",
+                        key=f"toggle_{field_name}",
+                        on_click=_toggle_field,
+                        args=(open_key,),
+                        use_container_width=True
+                    )
                 
-                with st.expander(f"{status_emoji} {field_name.replace('_', ' ').title()} ({len(facts)} fact{'s' if len(facts) > 1 else ''})", expanded=False):
-                    st.markdown(f"**Policy Field:** `{fact_name}`")
-                    st.markdown(f"**Status:** {status}")
+                    if st.session_state.get(open_key, False):
+                        fact_name = facts[0]["fact_name"]
+                        if not fact_name:
+                            fact_name = field_titles[field_name]
                     
-                    # Create facts table with updated columns
-                    facts_data = []
-                    for fact in facts:
-                        facts_data.append({
-                            "Value": fact["value"],
-                            "Document": fact["document_title"],
-                            "Fact Name": fact["fact_name"],
-                            "Source Sentence": fact.get("source_sentence", "N/A"),
-                            "Reference": fact["reference"]
-                        })
+                        st.markdown(f"**Policy Field:** `{fact_name}`\n\n**Status:** {status}")
                     
-                    df = pd.DataFrame(facts_data)
-                    st.dataframe(df, use_container_width=True)
+                        # Create facts table with updated columns
+                        df = _fact_table(
+                            summary.data_key, field_name,
+                            ("Value", "Document", "Fact Name", "Source Sentence", "Reference"), facts
+                        )
+                        st.dataframe(df, use_container_width=True, column_config=_FACT_TABLE_COLUMN_CONFIG)
                     
-                    # Show status-specific information
-                    if status == "Inconsistent":
-                        st.markdown("""
-                        <div style="background-color: #fff3cd; padding: 10px; border-radius: 5px; margin-top: 10px;">
-                            <strong>⚠️ Action Required:</strong> This field has conflicting values across documents. Review and standardize to ensure consistency.
-                        </div>
-                        """, unsafe_allow_html=True)
-                    else:
-                        st.markdown("""
-                        <div style="background-color: #d4edda; padding: 10px; border-radius: 5px; margin-top: 10px;">
-                            <strong>✅ Well Aligned:</strong> This field maintains consistent values across all documents.
-                        </div>
-                        """, unsafe_allow_html=True)
+                        # Show status-specific information
+                        if status == "Inconsistent":
+                            st.markdown("""
+                            <div style="background-color: #fff3cd; padding: 10px; border-radius: 5px; margin-top: 10px;">
+                                <strong>⚠️ Action Required:</strong> This field has conflicting values across documents. Review and standardize to ensure consistency.
+                            </div>
+                            """, unsafe_allow_html=True)
+                        else:
+                            st.markdown("""
+                            <div style="background-color: #d4edda; padding: 10px; border-radius: 5px; margin-top: 10px;">
+                                <strong>✅ Well Aligned:</strong> This field maintains consistent values across all documents.
+                            </div>
+                            """, unsafe_allow_html=True)
     
     with tab2:
-        st.header("⚠️ Policy Inconsistencies Requiring Attention")
+        if tab2.open:
+            st.header("⚠️ Policy Inconsistencies Requiring Attention")
         
-        if not inconsistent_facts:
-            st.success("🎉 No inconsistencies found! All policies are aligned.")
-        else:
-            st.markdown("""
-            <div class="warning-box">
-                <strong>⚠️ Critical Issues Found:</strong> The following policy fields have conflicting values across different documents. 
-                This may lead to confusion, compliance issues, or operational problems.
-            </div>
-            """, unsafe_allow_html=True)
+            if not inconsistent_facts:
+                st.success("🎉 No inconsistencies found! All policies are aligned.")
+            else:
+                st.markdown("""
+                <div class="warning-box">
+                    <strong>⚠️ Critical Issues Found:</strong> The following policy fields have conflicting values across different documents. 
+                    This may lead to confusion, compliance issues, or operational problems.
+                </div>
+                """, unsafe_allow_html=True)
             
-            for idx, (field_name, facts) in enumerate(inconsistent_facts.items(), 1):
-                with st.expander(f"🔴 {field_name.replace('_', ' ').title()} ({len(facts)} conflicts)", expanded=True):
-                    # Use the most common fact_name or a generic one for the field
-                    display_fact_name = facts[0]['fact_name'] if len(set(fact['fact_name'] for fact in facts)) == 1 else field_name.replace('_', ' ').title()
-                    st.markdown(f"**Policy Field:** {display_fact_name}")
-                    
-                    # Create comparison table with updated columns
-                    comparison_data = []
-                    for fact in facts:
-                        comparison_data.append({
-                            "Value": fact["value"],
-                            "Document": fact["document_title"],
-                            "Source Sentence": fact.get("source_sentence", "N/A"),
-                            "Reference": fact["reference"]
-                        })
+                for idx, (field_name, facts) in enumerate(inconsistent_facts.items(), 1):
+                    with st.expander(f"🔴 {field_titles[field_name]} ({len(facts)} conflicts)", expanded=True):
+                        # Use the most common fact_name or a generic one for the field
+                        first_fact_name = facts[0]['fact_name']
+                        all_same = all(fact['fact_name'] == first_fact_name for fact in facts)
+                        display_fact_name = first_fact_name if all_same else field_titles[field_name]
+                        st.markdown(f"**Policy Field:** {display_fact_name}")
                     
-                    df = pd.DataFrame(comparison_data)
-                    st.dataframe(df, use_container_width=True)
+                        # Create comparison table with updated columns
+                        df = _fact_table(
+                            summary.data_key, field_name,
+                            ("Value", "Document", "Source Sentence", "Reference"), facts
+                        )
+                        st.dataframe(df, use_container_width=True, column_config=_FACT_TABLE_COLUMN_CONFIG)
                     
-                    # Recommendation box
-                    st.markdown("""
-                    <div style="background-color: #fff3cd; padding: 10px; border-radius: 5px; margin-top: 10px;">
-                        <strong>💡 Recommendation:</strong> Review and standardize this policy across all documents to ensure consistency.
-                    </div>
-                    """, unsafe_allow_html=True)
+                        # Recommendation box
+                        st.markdown("""
+                        <div style="background-color: #fff3cd; padding: 10px; border-radius: 5px; margin-top: 10px;">
+                            <strong>💡 Recommendation:</strong> Review and standardize this policy across all documents to ensure consistency.
+                        </div>
+                        """, unsafe_allow_html=True)
     
     with tab3:
-        st.header("✅ Consistent Policy Facts")
+        if tab3.open:
+            st.header("✅ Consistent Policy Facts")
         
-        if not consistent_facts:
-            st.warning("No consistent facts found in the current dataset.")
-        else:
-            st.markdown("""
-            <div class="info-box">
-                <strong>✅ Well-Aligned Policies:</strong> These policy fields have consistent values across documents, 
-                indicating good policy governance and documentation practices.
-            </div>
-            """, unsafe_allow_html=True)
+            if not consistent_facts:
+                st.warning("No consistent facts found in the current dataset.")
+            else:
+                st.markdown("""
+                <div class="info-box">
+                    <strong>✅ Well-Aligned Policies:</strong> These policy fields have consistent values across documents, 
+                    indicating good policy governance and documentation practices.
+                </div>
+                """, unsafe_allow_html=True)
             
-            # Create a clean display of consistent facts
-            for field_name, facts in consistent_facts.items():
-                fact = facts[0]  # Since consistent facts have only one entry
-                
-                col1, col2 = st.columns([3, 1])
-                
-                with col1:
-                    st.markdown(f"""
-                    <div class="consistent-metric">
-                        <h4>{field_name.replace('_', ' ').title()}</h4>
-                        <p><strong>Value:</strong> {fact['value']}</p>
-                        <p><strong>Source:</strong> "{fact.get('source_sentence', 'N/A')[:100]}{'...' if len(fact.get('source_sentence', '')) > 100 else ''}"</p>
-                        <span class="doc-badge">{fact['document_title']}</span>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col2:
-                    st.markdown("✅ **Consistent**")
+                # Create a clean display of consistent facts (one HTML block for all of them)
+                st.html(_consistent_facts_html(summary.data_key, consistent_facts, field_titles))
     
     with tab4:
-        st.header("📊 Policy Consistency Analytics")
-        
-        # Consistency overview chart
-        consistency_data = {
-            'Status': ['Consistent', 'Inconsistent'],
-            'Count': [len(consistent_facts), len(inconsistent_facts)],
-            'Color': ['#4CAF50', '#F44336']
-        }
+        if tab4.open:
+            st.header("📊 Policy Consistency Analytics")
         
-        fig_pie = px.pie(
-            values=consistency_data['Count'], 
-            names=consistency_data['Status'],
-            title="Overall Policy Consistency Distribution",
-            color_discrete_map={'Consistent': '#4CAF50', 'Inconsistent': '#F44336'}
-        )
-        st.plotly_chart(fig_pie, use_container_width=True)
+            # Consistency overview chart
+            fig_pie = go.Figure(_consistency_pie_figure(
+                _CONSISTENCY_STATUSES,
+                (len(consistent_facts), len(inconsistent_facts)),
+                _CONSISTENCY_COLORS
+            ))
+            st.plotly_chart(fig_pie, use_container_width=True)
         
-        # Document-wise analysis
-        if inconsistent_facts:
-            st.subheader("📄 Documents Contributing to Inconsistencies")
+            # Document-wise analysis
+            if inconsistent_facts:
+                st.subheader("📄 Documents Contributing to Inconsistencies")
             
-            doc_inconsistencies = {}
-            for field_name, facts in inconsistent_facts.items():
-                for fact in facts:
-                    doc_name = fact['document_title']
-                    if doc_name not in doc_inconsistencies:
-                        doc_inconsistencies[doc_name] = 0
-                    doc_inconsistencies[doc_name] += 1
-            
-            doc_df = pd.DataFrame([
-                {'Document': doc, 'Inconsistent Fields': count}
-                for doc, count in doc_inconsistencies.items()
-            ])
-            
-            fig_bar = px.bar(
-                doc_df, 
-                x='Document', 
-                y='Inconsistent Fields',
-                title="Inconsistent Fields by Document",
-                color='Inconsistent Fields',
-                color_continuous_scale='Reds'
-            )
-            fig_bar.update_xaxes(tickangle=45)
-            st.plotly_chart(fig_bar, use_container_width=True)
+                fig_bar = go.Figure(_document_inconsistency_bar_figure(
+                    tuple(summary.doc_inconsistencies.items())
+                ))
+                st.plotly_chart(fig_bar, use_container_width=True)
 
+def show_facts_overview_popup():
+    """Display Facts Overview popup with the complete policy analyzer"""
+    
+    # Facts Overview CSS
+    st.html(_FACTS_OVERVIEW_CSS)
+    
+    # Header
+    st.title("🔍 Policy Document Inconsistency Analyzer")
+    st.markdown("---")
+    
+    # Load data
+    data = load_facts_data()
+    
+    # Sidebar
+    st.sidebar.header("📊 Dashboard Controls")
+    
+    # File upload option
+    uploaded_file = st.sidebar.file_uploader("Upload JSON Data", type=['json'])
+    if uploaded_file is not None:
+        data = parse_uploaded_facts(uploaded_file.getvalue())
+    
+    # Metrics and tabs rerun on their own when the user interacts with them
+    show_facts_analysis(data)
+    
     # Close button for popup
-    if st.button("✖️ Close Facts Overview", type="primary", use_container_width=True):
-        st.session_state.show_facts_popup = False
-        st.rerun()
+    st.button(
+        "✖️ Close Facts Overview",
+        type="primary",
+        use_container_width=True,
+        on_click=_set_view,
+        args=("main",)
+    )
 
     # Footer
-    st.markdown("---")
     st.markdown("""
+    ---
+
     <div style="text-align: center; color: #666; font-size: 14px;">
         Policy Document Inconsistency Analyzer | Built with ❤️ using Streamlit
     </div>
     """, unsafe_allow_html=True)
 
+# Custom CSS for the three-panel layout (built once at import)
+_MAIN_CSS = """
+<style>
+.main-header {
+    background: linear-gradient(90deg, #1e3c72 0%, #2a5298 100%);
+    color: white;
+    padding: 1rem;
+    border-radius: 10px;
+    margin-bottom: 1rem;
+    text-align: center;
+}
+
+.panel-header {
+    background-color: #f8f9fa;
+    padding: 0.5rem;
+    border-left: 4px solid #2a5298;
+    margin-bottom: 1rem;
+    font-weight: bold;
+}
+
+.stTabs [data-baseweb="tab-list"] {
+    gap: 2px;
+}
+
+.stTabs [data-baseweb="tab"] {
+    height: 50px;
+    padding-left: 20px;
+    padding-right: 20px;
+}
+
+.mindmap-container {
+    height: 500px;
+    overflow: auto;
+}
+
+.facts-preview {
+    width: 100%;
+    border-collapse: collapse;
+}
+
+.facts-preview td {
+    padding: 0.4rem 0.6rem;
+    border-bottom: 1px solid #e0e0e0;
+}
+
+.facts-preview td:last-child {
+    text-align: right;
+    font-weight: 600;
+}
+</style>
+"""
+
+# Page header, sent together with the stylesheet as a single element
+_MAIN_HEADER_HTML = """
+<div class="main-header">
+    <h1>Organization Policy Analyzer</h1>
+    <p>Comprehensive document analysis and mind mapping interface</p>
+</div>
+"""
+
+_MAIN_CHROME_HTML = _MAIN_CSS + _MAIN_HEADER_HTML
+
+# Session state defaults, applied for any key not yet set
+_SESSION_DEFAULTS = {
+    "selected_doc_id": None,
+    "mindmap_generated": False,
+    "mindmap_content": None,
+    "mindmap_data": None,
+    "mindmap_stats": None,
+    "view": "main",  # "main", "fullscreen" or "facts"
+}
+
+def _set_view(view: str):
+    """Switch the page view from a button callback (no extra st.rerun needed)"""
+    st.session_state.view = view
+
+@st.fragment
+def _studio_panel():
+    """Studio panel (mind map and facts tabs); its own widgets rerun only this panel"""
+    st.html('<div class="panel-header">🎛️ Studio</div>')
+    
+    with st.container():
+        # Updated tabs to include Facts Overview after Mind Map
+        tab1, tab2 = st.tabs(["🗺️ Mind Map", "📊 Facts Overview"])
+        
+        with tab1:
+            st.markdown("### 🧠 Document Mind Map")
+            
+            # Generate mind map button - now uses static content
+            if st.button("🚀 Load Mind Map", type="primary", use_container_width=True):
+                markdown_content, audit_data, mindmap_stats = generate_audit_mindmap()
+                
+                if markdown_content:
+                    st.session_state.mindmap_generated = True
+                    st.session_state.mindmap_content = markdown_content
+                    st.session_state.mindmap_data = audit_data
+                    st.session_state.mindmap_stats = mindmap_stats
+                    st.session_state.view = "fullscreen"
+                    st.rerun()
+                else:
+                    st.error("❌ Mind map loading failed")
+            
+            # Display mind map preview if generated (state read once for the whole preview)
+            mindmap_content = st.session_state.mindmap_content
+            audit_data = st.session_state.mindmap_data
+            if st.session_state.mindmap_generated and mindmap_content:
+                st.divider()
+                
+                # Show summary
+                if audit_data:
+                    st.markdown(f"**🎯 {audit_data.get('unified_title', 'Audit Analysis')}**")
+                    
+                    mindmap_stats = st.session_state.mindmap_stats
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.metric("Documents", mindmap_stats["documents"])
+                    with col2:
+                        st.metric("Insights", mindmap_stats["insights"])
+                
+                # Open fullscreen button
+                if st.button("🔍 Open Fullscreen View", use_container_width=True):
+                    st.session_state.view = "fullscreen"
+                    st.rerun()
+                
+                # Interactive mind map preview, only mounted while its expander is open
+                preview = st.expander(
+                    "🧠 Preview mind map",
+                    expanded=False,
+                    key="mindmap_preview",
+                    on_change="rerun"
+                )
+                if preview.open:
+                    from streamlit_markmap import markmap
+                    with preview:
+                        st.html('<div class="mindmap-container">')
+                        markmap(mindmap_content, height=400)
+                        st.html('</div>')
+                
+                # Download options
+                st.download_button(
+                    "💾 Download Mind Map",
+                    mindmap_content,
+                    f"mindmap_{content_suffix(mindmap_content)}.md",
+                    "text/markdown",
+                    use_container_width=True
+                )
+            
+            else:
+                st.info("👆 Click 'Load Mind Map' to display the pre-built interactive mind map")
+        
+        with tab2:
+            st.markdown("### 📊 Policy Facts Analysis")
+            st.info("📋 Analyze policy inconsistencies and facts across documents")
+            
+            # Button to open Facts Overview popup
+            if st.button("🔍 Open Facts Overview", type="primary", use_container_width=True):
+                st.session_state.view = "facts"
+                st.rerun()
+            
+            # Preview of facts analysis
+            st.markdown("**Preview:**")
+            summary = load_facts_summary()
+            st.html(facts_preview_html(
+                summary.total_facts,
+                len(summary.consistent_facts),
+                len(summary.inconsistent_facts),
+                summary.consistency_rate
+            ))
+
 def main():
     """Three-Panel Document Mind Map Interface"""
     st.set_page_config(
@@ -664,202 +1095,30 @@ def main():
         page_icon="🔒"
     )
 
-    # Custom CSS for three-panel layout
-    st.markdown("""
-    <style>
-    .main-header {
-        background: linear-gradient(90deg, #1e3c72 0%, #2a5298 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        margin-bottom: 1rem;
-        text-align: center;
-    }
-    
-    .panel-header {
-        background-color: #f8f9fa;
-        padding: 0.5rem;
-        border-left: 4px solid #2a5298;
-        margin-bottom: 1rem;
-        font-weight: bold;
-    }
-    
-    .document-item {
-        background: white;
-        border: 1px solid #e0e0e0;
-        border-radius: 8px;
-        padding: 1rem;
-        margin-bottom: 0.5rem;
-        cursor: pointer;
-        transition: all 0.3s ease;
-    }
-    
-    .document-item:hover {
-        border-color: #2a5298;
-        box-shadow: 0 2px 8px rgba(42, 82, 152, 0.1);
-    }
-    
-    .document-item.selected {
-        border-color: #2a5298;
-        background: #f8f9ff;
-        box-shadow: 0 2px 8px rgba(42, 82, 152, 0.2);
-    }
-    
-    .content-panel {
-        background: white;
-        border-radius: 8px;
-        padding: 1.5rem;
-        height: 600px;
-        overflow-y: auto;
-        border: 1px solid #e0e0e0;
-    }
-    
-    .tab-container {
-        background: white;
-        border-radius: 8px;
-        border: 1px solid #e0e0e0;
-        height: 600px;
-    }
-    
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 2px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
-        padding-left: 20px;
-        padding-right: 20px;
-    }
-    
-    .mindmap-container {
-        height: 500px;
-        overflow: auto;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
-    # Initialize session state
-    if 'selected_doc_id' not in st.session_state:
-        st.session_state.selected_doc_id = None
-    
-    if 'mindmap_generated' not in st.session_state:
-        st.session_state.mindmap_generated = False
-        st.session_state.mindmap_content = None
-        st.session_state.mindmap_data = None
-    
-    if 'show_fullscreen' not in st.session_state:
-        st.session_state.show_fullscreen = False
-    
-    # Initialize Facts Overview popup state
-    if 'show_facts_popup' not in st.session_state:
-        st.session_state.show_facts_popup = False
+    # Initialize session state (bound once; every access goes through Streamlit's proxy)
+    state = st.session_state
+    missing = _SESSION_DEFAULTS.keys() - state.keys()
+    if missing:
+        state.update({key: _SESSION_DEFAULTS[key] for key in missing})
 
-    # Check if fullscreen mode should be shown
-    if st.session_state.show_fullscreen and st.session_state.mindmap_content:
-        show_fullscreen_mindmap(st.session_state.mindmap_content, st.session_state.mindmap_data)
+    # Route to the active view; anything else falls through to the three-panel layout
+    view = state.view
+    if view == "fullscreen" and state.mindmap_content:
+        show_fullscreen_mindmap(state.mindmap_content, state.mindmap_data, state.mindmap_stats)
         return
     
-    # Check if Facts Overview popup should be shown
-    if st.session_state.show_facts_popup:
+    if view == "facts":
         show_facts_overview_popup()
         return
 
-    # Header
-    st.markdown("""
-    <div class="main-header">
-        <h1>Organization Policy Analyzer</h1>
-        <p>Comprehensive document analysis and mind mapping interface</p>
-    </div>
-    """, unsafe_allow_html=True)
+    # Stylesheet and page header for the three-panel layout, as one element
+    st.html(_MAIN_CHROME_HTML)
 
     left_col, middle_col, right_col = st.columns([1, 2, 1.5])
 
     # RIGHT PANEL - Tabs (Mind Map, Facts Overview, etc.)
     with right_col:
-        st.markdown('<div class="panel-header">🎛️ Studio</div>', unsafe_allow_html=True)
-        
-        with st.container():
-            # Updated tabs to include Facts Overview after Mind Map
-            tab1, tab2 = st.tabs(["🗺️ Mind Map", "📊 Facts Overview"])
-            
-            with tab1:
-                st.markdown("### 🧠 Document Mind Map")
-                
-                # Generate mind map button - now uses static content
-                if st.button("🚀 Load Mind Map", type="primary", use_container_width=True):
-                    with st.spinner("📂 Loading static mind map..."):
-                        markdown_content, audit_data = generate_audit_mindmap()
-                        
-                        if markdown_content:
-                            st.session_state.mindmap_generated = True
-                            st.session_state.mindmap_content = markdown_content
-                            st.session_state.mindmap_data = audit_data
-                            st.session_state.show_fullscreen = True
-                            st.success("✅ Mind map loaded!")
-                            st.rerun()
-                        else:
-                            st.error("❌ Mind map loading failed")
-                
-                # Display mind map preview if generated
-                if st.session_state.mindmap_generated and st.session_state.mindmap_content:
-                    st.markdown("---")
-                    
-                    # Show summary
-                    if st.session_state.mindmap_data:
-                        audit_data = st.session_state.mindmap_data
-                        st.markdown(f"**🎯 {audit_data.get('unified_title', 'Audit Analysis')}**")
-                        
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.metric("Documents", len(audit_data.get("documents", [])))
-                        with col2:
-                            total_insights = sum(len(doc.get("audit_insights", [])) for doc in audit_data.get("documents", []))
-                            st.metric("Insights", total_insights)
-                    
-                    # Open fullscreen button
-                    if st.button("🔍 Open Fullscreen View", use_container_width=True):
-                        st.session_state.show_fullscreen = True
-                        st.rerun()
-                    
-                    # Interactive mind map preview in container
-                    st.markdown('<div class="mindmap-container">', unsafe_allow_html=True)
-                    markmap(st.session_state.mindmap_content, height=400)
-                    st.markdown('</div>', unsafe_allow_html=True)
-                    
-                    # Download options
-                    st.download_button(
-                        "💾 Download Mind Map",
-                        st.session_state.mindmap_content,
-                        f"mindmap_{uuid.uuid4().hex[:8]}.md",
-                        "text/markdown",
-                        use_container_width=True
-                    )
-                
-                else:
-                    st.info("👆 Click 'Load Mind Map' to display the pre-built interactive mind map")
-            
-            with tab2:
-                st.markdown("### 📊 Policy Facts Analysis")
-                st.info("📋 Analyze policy inconsistencies and facts across documents")
-                
-                # Button to open Facts Overview popup
-                if st.button("🔍 Open Facts Overview", type="primary", use_container_width=True):
-                    st.session_state.show_facts_popup = True
-                    st.rerun()
-                
-                # Preview of facts analysis
-                st.markdown("**Preview:**")
-                facts_data = load_facts_data()
-                inconsistent_facts, consistent_facts = categorize_facts(facts_data)
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric("Total Facts", len(facts_data))
-                    st.metric("Consistent", len(consistent_facts))
-                with col2:
-                    st.metric("Inconsistencies", len(inconsistent_facts))
-                    consistency_rate = (len(consistent_facts) / len(facts_data)) * 100 if facts_data else 0
-                    st.metric("Consistency Rate", f"{consistency_rate:.1f}%")
+        _studio_panel()
 
 if __name__ == "__main__":
     main()
@@ -1,123 +1,128 @@
-import uuid
 import os
 import warnings
-import json
 import re
+import secrets
+import hashlib
+import orjson
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from pydantic import BaseModel, Field, model_validator
-from typing_extensions import Self
-from typing import List, Union, Dict, Optional
-from streamlit_markmap_local import markmap
-
-# Keep the existing Pydantic models for compatibility
-class AuditSubNode(BaseModel):
-    sub_title: str = Field(description="3-5 words describing this specific aspect")
-    sub_content: str = Field(description="Brief specific point (max 40 words)")
-
-class AuditInsightNode(BaseModel):
-    node_title: str = Field(description="5-7 words describing the audit insight", max_length=50)
-    sub_nodes: List[AuditSubNode] = Field(description="2-4 specific sub-aspects of this insight", min_items=2, max_items=4)
-
-class ProcessedAuditDocument(BaseModel):
+from typing import List, Union, Dict, Optional, TypedDict
+
+# Shapes of the audit data built by parse_markdown_to_audit_data. These are
+# TypedDicts (plain dicts at runtime) so the static-load path pays nothing for them.
+class AuditSubNode(TypedDict):
+    sub_title: str  # 3-5 words describing this specific aspect
+    sub_content: str  # Brief specific point (max 40 words)
+
+class AuditInsightNode(TypedDict):
+    node_title: str  # 5-7 words describing the audit insight
+    sub_nodes: List[AuditSubNode]  # 2-4 specific sub-aspects of this insight
+
+class ProcessedAuditDocument(TypedDict):
     document_id: str
     document_title: str
     document_type: str
-    audit_insights: List[AuditInsightNode] = Field(description="3-6 most important audit insights from this document")
+    audit_insights: List[AuditInsightNode]  # 3-6 most important audit insights from this document
 
-class UnifiedAuditMindMap(BaseModel):
-    unified_title: str = Field(description="5-7 words summarizing the audit scope of all documents")
-    audit_context: str = Field(description="Brief description of what this collection tells auditors")
-    documents: List[ProcessedAuditDocument] = Field(description="All processed documents with audit insights")
-    
-    @model_validator(mode="after")
-    def validate_audit_structure(self) -> Self:
-        if not self.documents:
-            raise ValueError("Must have at least one document")
-        if len(self.unified_title.split()) > 7:
-            raise ValueError("Unified title must be 5-7 words maximum")
-        return self
+class UnifiedAuditMindMap(TypedDict):
+    unified_title: str  # 5-7 words summarizing the audit scope of all documents
+    audit_context: str  # Brief description of what this collection tells auditors
+    documents: List[ProcessedAuditDocument]  # All processed documents with audit insights
 
 class AuditMindMapWarning(Warning):
     """Warning for audit mind map generation failures"""
 
 # MODIFIED FUNCTIONS TO USE STATIC MARKDOWN FILE
 
+# The spinner only shows on a cache miss; repeat loads return without any UI chrome
+@st.cache_resource(show_spinner="Loading TechCorp policy analysis...")
 def load_static_mindmap() -> tuple:
-    """Load the pre-saved mindmap markdown file"""
+    """Load the pre-saved mindmap markdown file (once per process, shared read-only)"""
     mindmap_file = "mindmap_5038c8c4.md"
     
     try:
         # Read the markdown content
-        with open(mindmap_file, 'r', encoding='utf-8') as file:
-            markdown_content = file.read()
+        with open(mindmap_file, 'rb') as file:
+            markdown_content = file.read().decode('utf-8')
         
         # Create mock audit data structure based on the markdown content
         audit_data = parse_markdown_to_audit_data(markdown_content)
         
-        return markdown_content, audit_data
+        return markdown_content, audit_data, compute_mindmap_stats(markdown_content, audit_data)
         
     except FileNotFoundError:
         # Fallback with the provided content if file not found
         markdown_content = """"""
         
         audit_data = parse_markdown_to_audit_data(markdown_content)
-        return markdown_content, audit_data
+        return markdown_content, audit_data, compute_mindmap_stats(markdown_content, audit_data)
+
+# One heading line of the static mind map: "#..#### <emoji> text" or "##### text"
+_HEADING_RE = re.compile(
+    r'^[^\S\n]*(?:#####[^\S\n]|(#{1,4})[^\S\n]+(🔍|📋|🎯|🔸))[^\S\n]*(.*?)[^\S\n]*$',
+    re.MULTILINE
+)
+
+# (heading hashes, emoji marker) -> node kind; "#####" content lines match neither group
+_HEADING_KINDS = {
+    ('#', '🔍'): 'title',
+    ('##', '📋'): 'document',
+    ('###', '🎯'): 'insight',
+    ('####', '🔸'): 'sub_title',
+    (None, None): 'sub_content',
+}
 
 def parse_markdown_to_audit_data(markdown_content: str) -> Dict:
     """Parse markdown content into audit data structure"""
-    lines = markdown_content.split('\n')
-    
-    # Extract title
-    unified_title = "Integrated Controls Framework Overview"
-    for line in lines:
-        if line.startswith('# 🔍'):
-            unified_title = line.replace('# 🔍', '').strip()
-            break
+    unified_title = None
     
-    # Parse documents and insights
+    # Parse title, documents and insights in a single pass
     documents = []
     current_doc = None
     current_insight = None
     
-    for line in lines:
-        line = line.strip()
-        if line.startswith('## 📋'):
+    for match in _HEADING_RE.finditer(markdown_content):
+        hashes, marker, text = match.groups()
+        kind = _HEADING_KINDS.get((hashes, marker))
+        
+        if kind is None:
+            continue
+        
+        elif kind == 'title':
+            # Extract title (first one wins)
+            if unified_title is None:
+                unified_title = text
+        
+        elif kind == 'document':
             # New document
             if current_doc:
                 documents.append(current_doc)
             current_doc = {
-                "document_id": str(uuid.uuid4())[:8],
-                "document_title": line.replace('## 📋', '').strip(),
+                "document_id": "",  # filled in below once the documents are counted
+                "document_title": text,
                 "document_type": "Policy Document",
                 "audit_insights": []
             }
             
-        elif line.startswith('### 🎯'):
+        elif kind == 'insight':
             # New insight
             if current_insight and current_doc:
                 current_doc["audit_insights"].append(current_insight)
             current_insight = {
-                "node_title": line.replace('### 🎯', '').strip(),
+                "node_title": text,
                 "sub_nodes": []
             }
             
-        elif line.startswith('#### 🔸'):
+        elif kind == 'sub_title':
             # Sub node title
             if current_insight:
-                sub_title = line.replace('#### 🔸', '').strip()
                 current_insight["sub_nodes"].append({
-                    "sub_title": sub_title,
+                    "sub_title": text,
                     "sub_content": ""
                 })
                 
-        elif line.startswith('##### ') and current_insight and current_insight["sub_nodes"]:
+        elif current_insight and current_insight["sub_nodes"]:
             # Sub node content
-            content = line.replace('#####', '').strip()
-            current_insight["sub_nodes"][-1]["sub_content"] = content
+            current_insight["sub_nodes"][-1]["sub_content"] = text
     
     # Add last insight and document
     if current_insight and current_doc:
@@ -125,8 +130,13 @@ def parse_markdown_to_audit_data(markdown_content: str) -> Dict:
     if current_doc:
         documents.append(current_doc)
     
+    # Draw random bytes for every document id in one call (8 hex chars each)
+    document_ids = secrets.token_hex(4 * len(documents))
+    for index, doc in enumerate(documents):
+        doc["document_id"] = document_ids[8 * index:8 * index + 8]
+    
     return {
-        "unified_title": unified_title,
+        "unified_title": unified_title or "Integrated Controls Framework Overview",
         "audit_context": "Comprehensive framework covering security, data governance, risk management and audit controls",
         "documents": documents
     }
@@ -135,17 +145,47 @@ def generate_audit_mindmap(documents: List[Dict] = None) -> Union[tuple, tuple]:
     """Generate audit-focused mind map using static markdown file"""
     try:
         # Ignore the documents parameter and use static content
-        markdown_content, audit_data = load_static_mindmap()
-        return markdown_content, audit_data
+        markdown_content, audit_data, mindmap_stats = load_static_mindmap()
+        return markdown_content, audit_data, mindmap_stats
         
     except Exception as e:
         warnings.warn(
             message=f"Static mind map loading failed: {e}",
             category=AuditMindMapWarning,
         )
-        return None, None
+        return None, None, None
 
-def show_fullscreen_mindmap(mindmap_content: str, audit_data: Dict):
+def compute_mindmap_stats(markdown_content: str, audit_data: Dict) -> Dict:
+    """Count the documents, insights, controls and words shown in the mind map stats"""
+    # Count insights and controls in one traversal
+    documents = audit_data.get("documents", ())
+    total_insights = 0
+    total_subnodes = 0
+    for doc in documents:
+        insights = doc.get("audit_insights", ())
+        total_insights += len(insights)
+        for insight in insights:
+            total_subnodes += len(insight.get("sub_nodes", ()))
+    
+    return {
+        "documents": len(documents),
+        "insights": total_insights,
+        "controls": total_subnodes,
+        "words": len(markdown_content.split()),
+    }
+
+@st.cache_data(show_spinner=False)
+def audit_data_to_json(audit_data: Dict) -> bytes:
+    """Serialize audit data as indented JSON for the export download"""
+    return orjson.dumps(audit_data, option=orjson.OPT_INDENT_2)
+
+def content_suffix(content: Union[str, bytes]) -> str:
+    """Short content hash used to keep download filenames stable across reruns"""
+    if isinstance(content, str):
+        content = content.encode()
+    return hashlib.blake2b(content, digest_size=4).hexdigest()
+
+def show_fullscreen_mindmap(mindmap_content: str, audit_data: Dict, mindmap_stats: Dict):
     """Display fullscreen mind map modal similar to NotebookLM"""
     
     # Modal CSS styling
@@ -263,36 +303,30 @@ def show_fullscreen_mindmap(mindmap_content: str, audit_data: Dict):
         </div>
         """, unsafe_allow_html=True)
         
-        # Statistics section
-        total_insights = sum(len(doc.get("audit_insights", [])) for doc in audit_data.get("documents", []))
-        total_subnodes = sum(
-            len(insight.get("sub_nodes", [])) 
-            for doc in audit_data.get("documents", []) 
-            for insight in doc.get("audit_insights", [])
-        )
-        
+        # Statistics section (counted once when the mind map was loaded)
         st.markdown(f"""
         <div class="mindmap-stats">
             <div class="stat-item">
-                <span class="stat-number">{len(audit_data.get("documents", []))}</span>
+                <span class="stat-number">{mindmap_stats["documents"]}</span>
                 <div class="stat-label">Documents</div>
             </div>
             <div class="stat-item">
-                <span class="stat-number">{total_insights}</span>
+                <span class="stat-number">{mindmap_stats["insights"]}</span>
                 <div class="stat-label">Insights</div>
             </div>
             <div class="stat-item">
-                <span class="stat-number">{total_subnodes}</span>
+                <span class="stat-number">{mindmap_stats["controls"]}</span>
                 <div class="stat-label">Controls</div>
             </div>
             <div class="stat-item">
-                <span class="stat-number">{len(mindmap_content.split())}</span>
+                <span class="stat-number">{mindmap_stats["words"]}</span>
                 <div class="stat-label">Words</div>
             </div>
         </div>
         """, unsafe_allow_html=True)
         
-        # Mind map container
+        # Mind map container (component imported on first render only)
+        from streamlit_markmap_local import markmap
         st.markdown('<div class="mindmap-container-fullscreen">', unsafe_allow_html=True)
         markmap(mindmap_content, height=600)
         st.markdown('</div>', unsafe_allow_html=True)
@@ -301,24 +335,23 @@ def show_fullscreen_mindmap(mindmap_content: str, audit_data: Dict):
         col1, col2, col3, col4 = st.columns([1, 1, 1, 2])
         
         with col1:
-            if st.button("💾 Download", use_container_width=True):
-                st.download_button(
-                    "📥 Download MD",
-                    mindmap_content,
-                    f"mindmap_{uuid.uuid4().hex[:8]}.md",
-                    "text/markdown",
-                    use_container_width=True
-                )
+            st.download_button(
+                "💾 Download",
+                mindmap_content,
+                f"mindmap_{content_suffix(mindmap_content)}.md",
+                "text/markdown",
+                use_container_width=True
+            )
         
         with col2:
-            if st.button("📊 Export JSON", use_container_width=True):
-                st.download_button(
-                    "📥 Download JSON",
-                    json.dumps(audit_data, indent=2),
-                    f"mindmap_data_{uuid.uuid4().hex[:8]}.json",
-                    "application/json",
-                    use_container_width=True
-                )
+            json_bytes = audit_data_to_json(audit_data)
+            st.download_button(
+                "📊 Export JSON",
+                json_bytes,
+                f"mindmap_data_{content_suffix(json_bytes)}.json",
+                "application/json",
+                use_container_width=True
+            )
         
         with col3:
             if st.button("🔄 Regenerate", use_container_width=True):
@@ -332,17 +365,26 @@ def show_fullscreen_mindmap(mindmap_content: str, audit_data: Dict):
                 st.rerun()
 
 
+# Policy fields that are checked for conflicting values across documents
+_INCONSISTENT_KEYS = frozenset({
+    'security_training_frequency',
+    'information_security_risk_assessment_frequency',
+    'recovery_time_objective',
+    'password_minimum_length',
+})
+
 # Facts Overview Functions (keeping unchanged from original)
+@st.cache_resource(show_spinner=False)
 def load_facts_data():
-    """Load the policy data"""
+    """Load the policy data (parsed once per process and shared read-only)"""
     factIndex_file = "factIndex.json"
     
     try:
         # Load JSON content
-        with open(factIndex_file, 'r', encoding='utf-8') as file:
-            factIndex_content = json.load(file)
+        with open(factIndex_file, 'rb') as file:
+            factIndex_content = orjson.loads(file.read())
         
-        return factIndex_content
+        return _normalize_facts(factIndex_content)
         
     except FileNotFoundError:
         # Fallback with the provided content if file not found
@@ -353,68 +395,139 @@ def load_facts_data():
     # sample_data = json.load(open("factIndex.json"))
     # return sample_data
 
+@st.cache_data(show_spinner=False)
+def parse_uploaded_facts(raw: bytes) -> Dict:
+    """Parse an uploaded fact index JSON (cached per file contents)"""
+    return _normalize_facts(orjson.loads(raw))
+
+def _normalize_facts(data: Dict) -> Dict:
+    """Fill optional fact keys once at load so the render loops can subscript directly"""
+    for facts in data.values():
+        for fact in facts:
+            fact.setdefault('source_sentence', 'N/A')
+    return data
+
 def categorize_facts(data):
     """Categorize facts into consistent and inconsistent"""
-    inconsistent_keys = ['security_training_frequency', 'information_security_risk_assessment_frequency', 
-                        'recovery_time_objective', 'password_minimum_length']
+    inconsistent_facts = {}
+    consistent_facts = {}
     
-    inconsistent_facts = {k: v for k, v in data.items() if k in inconsistent_keys and len(v) > 1}
-    consistent_facts = {k: v for k, v in data.items() if k not in inconsistent_keys or len(v) == 1}
+    # Partition the fields in a single pass over the data
+    for field_name, facts in data.items():
+        checked = field_name in _INCONSISTENT_KEYS
+        if checked and len(facts) > 1:
+            inconsistent_facts[field_name] = facts
+        elif not checked or len(facts) == 1:
+            consistent_facts[field_name] = facts
     
     return inconsistent_facts, consistent_facts
 
+@st.cache_data(show_spinner=False)
+def load_facts_counts() -> tuple:
+    """Count inconsistent and consistent fields in the bundled policy data (computed once)"""
+    inconsistent_facts, consistent_facts = categorize_facts(load_facts_data())
+    return len(inconsistent_facts), len(consistent_facts)
+
+# Facts Overview CSS (built once at import)
+_FACTS_OVERVIEW_CSS = """
+<style>
+    .inconsistent-metric {
+        background-color: #ffebee;
+        border: 2px solid #f44336;
+        border-radius: 10px;
+        padding: 10px;
+        margin: 5px 0;
+    }
+    .consistent-metric {
+        background-color: #e8f5e8;
+        border: 2px solid #4caf50;
+        border-radius: 10px;
+        padding: 10px;
+        margin: 5px 0;
+    }
+    .fact-metric {
+        background-color: #f5f5f5;
+        border: 2px solid #9e9e9e;
+        border-radius: 10px;
+        padding: 10px;
+        margin: 5px 0;
+    }
+    .warning-box {
+        background-color: #fff3cd;
+        border: 1px solid #ffeaa7;
+        border-radius: 5px;
+        padding: 15px;
+        margin: 10px 0;
+    }
+    .info-box {
+        background-color: #e3f2fd;
+        border: 1px solid #90caf9;
+        border-radius: 5px;
+        padding: 15px;
+        margin: 10px 0;
+    }
+    .doc-badge {
+        display: inline-block;
+        padding: 3px 8px;
+        margin: 2px;
+        background-color: #e1f5fe;
+        border-radius: 15px;
+        font-size: 12px;
+        border: 1px solid #0277bd;
+    }
+    .metrics-row {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 1rem;
+        margin-bottom: 1rem;
+    }
+    .overview-metric-label {
+        font-size: 14px;
+        color: #555;
+    }
+    .overview-metric-value {
+        font-size: 2rem;
+        font-weight: bold;
+    }
+    .overview-metric-delta {
+        font-size: 14px;
+    }
+</style>
+"""
+
+@st.cache_data(show_spinner=False)
+def _render_metrics_html(total: int, inconsistent: int, consistent: int, rate: float) -> str:
+    """Render the four overview metric cards as a single HTML row"""
+    return f"""
+    <div class="metrics-row">
+        <div class="fact-metric" title="Total number of objective facts analyzed">
+            <div class="overview-metric-label">📋 Total Objective Facts</div>
+            <div class="overview-metric-value">{total}</div>
+        </div>
+        <div class="inconsistent-metric" title="Fields with conflicting values across documents">
+            <div class="overview-metric-label">⚠️ Inconsistent Facts</div>
+            <div class="overview-metric-value">{inconsistent}</div>
+            <div class="overview-metric-delta" style="color: #4caf50;">↓ -{inconsistent} conflicts</div>
+        </div>
+        <div class="consistent-metric" title="Fields with consistent values across documents">
+            <div class="overview-metric-label">✅ Consistent Facts</div>
+            <div class="overview-metric-value">{consistent}</div>
+            <div class="overview-metric-delta" style="color: #4caf50;">↑ +{consistent} aligned</div>
+        </div>
+        <div class="fact-metric" title="Percentage of consistent policy fields">
+            <div class="overview-metric-label">📈 Consistency Rate</div>
+            <div class="overview-metric-value">{rate:.1f}%</div>
+        </div>
+    </div>
+    """
+
 def show_facts_overview_popup():
     """Display Facts Overview popup with the complete policy analyzer"""
+    # Tables are only needed once the overview is open
+    import pandas as pd
     
     # Facts Overview CSS
-    st.markdown("""
-    <style>
-        .inconsistent-metric {
-            background-color: #ffebee;
-            border: 2px solid #f44336;
-            border-radius: 10px;
-            padding: 10px;
-            margin: 5px 0;
-        }
-        .consistent-metric {
-            background-color: #e8f5e8;
-            border: 2px solid #4caf50;
-            border-radius: 10px;
-            padding: 10px;
-            margin: 5px 0;
-        }
-        .fact-metric {
-            background-color: #f5f5f5;
-            border: 2px solid #9e9e9e;
-            border-radius: 10px;
-            padding: 10px;
-            margin: 5px 0;
-        }
-        .warning-box {
-            background-color: #fff3cd;
-            border: 1px solid #ffeaa7;
-            border-radius: 5px;
-            padding: 15px;
-            margin: 10px 0;
-        }
-        .info-box {
-            background-color: #e3f2fd;
-            border: 1px solid #90caf9;
-            border-radius: 5px;
-            padding: 15px;
-            margin: 10px 0;
-        }
-        .doc-badge {
-            display: inline-block;
-            padding: 3px 8px;
-            margin: 2px;
-            background-color: #e1f5fe;
-            border-radius: 15px;
-            font-size: 12px;
-            border: 1px solid #0277bd;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    st.html(_FACTS_OVERVIEW_CSS)
     
     # Header
     st.title("🔍 Policy Document Inconsistency Analyzer")
@@ -430,44 +543,20 @@ def show_facts_overview_popup():
     # File upload option
     uploaded_file = st.sidebar.file_uploader("Upload JSON Data", type=['json'])
     if uploaded_file is not None:
-        data = json.load(uploaded_file)
+        data = parse_uploaded_facts(uploaded_file.getvalue())
         inconsistent_facts, consistent_facts = categorize_facts(data)
     
-    # Overview metrics
-    col1, col2, col3, col4 = st.columns(4)
+    # Overview metrics (counts computed once for all four cards)
+    total_facts = len(data)
+    inconsistent_count = len(inconsistent_facts)
+    consistent_count = len(consistent_facts)
+    consistency_rate = (consistent_count / total_facts * 100.0) if total_facts else 0.0
     
-    with col1:
-        st.metric(
-            label="📋 Total Objective Facts", 
-            value=len(data),
-            help="Total number of objective facts analyzed"
-        )
-    
-    with col2:
-        st.metric(
-            label="⚠️ Inconsistent Facts", 
-            value=len(inconsistent_facts),
-            delta=f"-{len(inconsistent_facts)} conflicts",
-            delta_color="inverse",
-            help="Fields with conflicting values across documents"
-        )
-    
-    with col3:
-        st.metric(
-            label="✅ Consistent Facts", 
-            value=len(consistent_facts),
-            delta=f"+{len(consistent_facts)} aligned",
-            delta_color="normal",
-            help="Fields with consistent values across documents"
-        )
+    # Display title for each policy field, built once instead of in every tab loop
+    field_titles = {field_name: field_name.replace('_', ' ').title() for field_name in data}
     
-    with col4:
-        consistency_rate = (len(consistent_facts) / len(data)) * 100 if data else 0
-        st.metric(
-            label="📈 Consistency Rate", 
-            value=f"{consistency_rate:.1f}%",
-            help="Percentage of consistent policy fields"
-        )
+    # All four cards in one element
+    st.html(_render_metrics_html(total_facts, inconsistent_count, consistent_count, consistency_rate))
     
     # Main content tabs
     tab1, tab2, tab3 = st.tabs(["📋 All Facts", "🚨 Inconsistencies", "✅ Consistent Facts"])
@@ -488,27 +577,25 @@ def show_facts_overview_popup():
             # Display all facts organized by policy field
             for idx, (field_name, facts) in enumerate(data.items(), 1):
                 # Determine if this field is consistent or inconsistent
-                status = "Inconsistent" if len(facts) > 1 and field_name in ['security_training_frequency', 'information_security_risk_assessment_frequency', 'recovery_time_objective', 'password_minimum_length'] else "Consistent"
+                status = "Inconsistent" if field_name in inconsistent_facts else "Consistent"
                 status_emoji = "⚠️" if status == "Inconsistent" else "✅"
                 
                 fact_name = facts[0]["fact_name"]
                 if not fact_name:
-                    fact_name = field_name.replace('_', ' ').title()
+                    fact_name = field_titles[field_name]
                 
-                with st.expander(f"{status_emoji} {field_name.replace('_', ' ').title()} ({len(facts)} fact{'s' if len(facts) > 1 else ''})", expanded=False):
+                with st.expander(f"{status_emoji} {field_titles[field_name]} ({len(facts)} fact{'s' if len(facts) > 1 else ''})", expanded=False):
                     st.markdown(f"**Policy Field:** `{fact_name}`")
                     st.markdown(f"**Status:** {status}")
                     
-                    # Create facts table with updated columns
-                    facts_data = []
+                    # Create facts table with updated columns (built column-wise)
+                    facts_data = {"Value": [], "Document": [], "Fact Name": [], "Source Sentence": [], "Reference": []}
                     for fact in facts:
-                        facts_data.append({
-                            "Value": fact["value"],
-                            "Document": fact["document_title"],
-                            "Fact Name": fact["fact_name"],
-                            "Source Sentence": fact.get("source_sentence", "N/A"),
-                            "Reference": fact["reference"]
-                        })
+                        facts_data["Value"].append(fact["value"])
+                        facts_data["Document"].append(fact["document_title"])
+                        facts_data["Fact Name"].append(fact["fact_name"])
+                        facts_data["Source Sentence"].append(fact["source_sentence"])
+                        facts_data["Reference"].append(fact["reference"])
                     
                     df = pd.DataFrame(facts_data)
                     st.dataframe(df, use_container_width=True)
@@ -541,20 +628,20 @@ def show_facts_overview_popup():
             """, unsafe_allow_html=True)
             
             for idx, (field_name, facts) in enumerate(inconsistent_facts.items(), 1):
-                with st.expander(f"🔴 {field_name.replace('_', ' ').title()} ({len(facts)} conflicts)", expanded=True):
+                with st.expander(f"🔴 {field_titles[field_name]} ({len(facts)} conflicts)", expanded=True):
                     # Use the most common fact_name or a generic one for the field
-                    display_fact_name = facts[0]['fact_name'] if len(set(fact['fact_name'] for fact in facts)) == 1 else field_name.replace('_', ' ').title()
+                    first_fact_name = facts[0]['fact_name']
+                    all_same = all(fact['fact_name'] == first_fact_name for fact in facts)
+                    display_fact_name = first_fact_name if all_same else field_titles[field_name]
                     st.markdown(f"**Policy Field:** {display_fact_name}")
                     
-                    # Create comparison table with updated columns
-                    comparison_data = []
+                    # Create comparison table with updated columns (built column-wise)
+                    comparison_data = {"Value": [], "Document": [], "Source Sentence": [], "Reference": []}
                     for fact in facts:
-                        comparison_data.append({
-                            "Value": fact["value"],
-                            "Document": fact["document_title"],
-                            "Source Sentence": fact.get("source_sentence", "N/A"),
-                            "Reference": fact["reference"]
-                        })
+                        comparison_data["Value"].append(fact["value"])
+                        comparison_data["Document"].append(fact["document_title"])
+                        comparison_data["Source Sentence"].append(fact["source_sentence"])
+                        comparison_data["Reference"].append(fact["reference"])
                     
                     df = pd.DataFrame(comparison_data)
                     st.dataframe(df, use_container_width=True)
@@ -588,9 +675,9 @@ def show_facts_overview_popup():
                 with col1:
                     st.markdown(f"""
                     <div class="consistent-metric">
-                        <h4>{field_name.replace('_', ' ').title()}</h4>
+                        <h4>{field_titles[field_name]}</h4>
                         <p><strong>Value:</strong> {fact['value']}</p>
-                        <p><strong>Source Sentence:</strong> "{fact.get('source_sentence', 'N/A')[:100]}{'...' if len(fact.get('source_sentence', '')) > 100 else ''}"</p>
+                        <p><strong>Source Sentence:</strong> "{fact['source_sentence'][:100]}{'...' if len(fact['source_sentence']) > 100 else ''}"</p>
                         <span class="doc-badge">{fact['document_title']}</span>
                     </div>
                     """, unsafe_allow_html=True)
@@ -675,20 +762,20 @@ def create_demo_landing_page():
                 use_container_width=True,
                 help="Launch interactive visualization of TechCorp's policy framework"
             ):
-                with st.spinner("Loading TechCorp policy analysis..."):
-                    try:
-                        markdown_content, audit_data = generate_audit_mindmap()
-                        if markdown_content:
-                            st.session_state.mindmap_generated = True
-                            st.session_state.mindmap_content = markdown_content
-                            st.session_state.mindmap_data = audit_data
-                            st.session_state.show_fullscreen = True
-                            st.success("✅ Mind map ready! Opening full analysis...")
-                            st.rerun()
-                        else:
-                            st.error("❌ Demo data loading failed")
-                    except Exception as e:
-                        st.error(f"❌ Error loading demo: {str(e)}")
+                try:
+                    markdown_content, audit_data, mindmap_stats = generate_audit_mindmap()
+                    if markdown_content:
+                        st.session_state.mindmap_generated = True
+                        st.session_state.mindmap_content = markdown_content
+                        st.session_state.mindmap_data = audit_data
+                        st.session_state.mindmap_stats = mindmap_stats
+                        st.session_state.show_fullscreen = True
+                        st.success("✅ Mind map ready! Opening full analysis...")
+                        st.rerun()
+                    else:
+                        st.error("❌ Demo data loading failed")
+                except Exception as e:
+                    st.error(f"❌ Error loading demo: {str(e)}")
             
             # Quick metrics
             metric_col1, metric_col2 = st.columns(2)
@@ -736,14 +823,13 @@ def create_demo_landing_page():
             
             # Load and display metrics
             try:
-                facts_data = load_facts_data()
-                inconsistent_facts, consistent_facts = categorize_facts(facts_data)
+                issues_found, aligned_policies = load_facts_counts()
                 
                 metric_col1, metric_col2 = st.columns(2)
                 with metric_col1:
-                    st.metric("Issues Found", len(inconsistent_facts), delta=None, delta_color="inverse")
+                    st.metric("Issues Found", issues_found, delta=None, delta_color="inverse")
                 with metric_col2:
-                    st.metric("Aligned Policies", len(consistent_facts), delta=None, delta_color="normal")
+                    st.metric("Aligned Policies", aligned_policies, delta=None, delta_color="normal")
             except Exception as e:
                 # Fallback metrics
                 metric_col1, metric_col2 = st.columns(2)
@@ -777,220 +863,223 @@ def create_demo_landing_page():
 
 
 
+# Demo presentation CSS (built once at import)
+_DEMO_CSS = """
+<style>
+.demo-header {
+    background: linear-gradient(135deg, #1e3c72 0%, #2a5298 50%, #3d5998 100%);
+    color: white;
+    padding: 2rem;
+    border-radius: 15px;
+    margin-bottom: 2rem;
+    text-align: center;
+    box-shadow: 0 8px 25px rgba(42, 82, 152, 0.3);
+}
+
+.demo-subtitle {
+    font-size: 1.2rem;
+    margin: 1rem 0;
+    opacity: 0.9;
+}
+
+.demo-stats {
+    display: flex;
+    justify-content: center;
+    gap: 3rem;
+    margin-top: 1.5rem;
+}
+
+.demo-stat {
+    text-align: center;
+    background: rgba(255,255,255,0.1);
+    padding: 1rem;
+    border-radius: 10px;
+    backdrop-filter: blur(10px);
+}
+
+.demo-stat .stat-number {
+    display: block;
+    font-size: 2rem;
+    font-weight: bold;
+    color: #fff;
+}
+
+.demo-stat .stat-label {
+    font-size: 0.9rem;
+    opacity: 0.8;
+}
+
+.demo-scenario {
+    background: #e3f2fd;
+    border: 1px solid #2196f3;
+    border-radius: 10px;
+    padding: 1.5rem;
+    margin-bottom: 2rem;
+}
+
+.demo-scenario h3 {
+    color: #1565c0;
+    margin-top: 0;
+}
+
+.demo-feature-card {
+    background: white;
+    border: 2px solid #e0e0e0;
+    border-radius: 12px;
+    padding: 1.5rem;
+    height: 100%;
+    box-shadow: 0 4px 12px rgba(0,0,0,0.1);
+    transition: all 0.3s ease;
+}
+
+.demo-feature-card:hover {
+    border-color: #2a5298;
+    box-shadow: 0 6px 20px rgba(42, 82, 152, 0.15);
+    transform: translateY(-2px);
+}
+
+.feature-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 1rem;
+    padding-bottom: 1rem;
+    border-bottom: 2px solid #f0f0f0;
+}
+
+.feature-header h2 {
+    margin: 0;
+    color: #1e3c72;
+    font-size: 1.4rem;
+}
+
+.feature-badge {
+    background: #ff4757;
+    color: white;
+    padding: 0.3rem 0.8rem;
+    border-radius: 20px;
+    font-size: 0.8rem;
+    font-weight: bold;
+}
+
+.feature-description ul {
+    margin: 1rem 0;
+    padding-left: 1.2rem;
+}
+
+.feature-description li {
+    margin: 0.5rem 0;
+    color: #333;
+}
+
+.demo-preview {
+    background: #f8f9fa;
+    border-left: 4px solid #2a5298;
+    padding: 1rem;
+    margin: 1rem 0;
+    border-radius: 0 8px 8px 0;
+}
+
+.demo-preview.alert-style {
+    background: #fff3cd;
+    border-left-color: #ffc107;
+}
+
+.quick-metrics {
+    display: flex;
+    justify-content: space-around;
+    margin-top: 1rem;
+    padding: 1rem;
+    background: #f8f9fa;
+    border-radius: 8px;
+}
+
+.quick-metrics.alert-border {
+    border: 1px solid #ffc107;
+}
+
+.metric-item {
+    text-align: center;
+}
+
+.metric-item.inconsistent .metric-value {
+    color: #dc3545;
+}
+
+.metric-item.consistent .metric-value {
+    color: #28a745;
+}
+
+.metric-value {
+    display: block;
+    font-size: 1.8rem;
+    font-weight: bold;
+    color: #2a5298;
+}
+
+.metric-name {
+    font-size: 0.9rem;
+    color: #666;
+}
+
+.demo-guidance {
+    background: #fff;
+    border: 2px solid #28a745;
+    border-radius: 12px;
+    padding: 1.5rem;
+    margin-top: 2rem;
+}
+
+.demo-guidance h3 {
+    color: #155724;
+    margin-top: 0;
+}
+
+.demo-steps {
+    display: flex;
+    gap: 1rem;
+    flex-wrap: wrap;
+}
+
+.step-item {
+    flex: 1;
+    min-width: 200px;
+    display: flex;
+    align-items: flex-start;
+    gap: 1rem;
+    background: #f8f9fa;
+    padding: 1rem;
+    border-radius: 8px;
+}
+
+.step-number {
+    background: #28a745;
+    color: white;
+    width: 30px;
+    height: 30px;
+    border-radius: 50%;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    font-weight: bold;
+    flex-shrink: 0;
+}
+
+.step-content strong {
+    color: #155724;
+}
+
+.step-content p {
+    margin: 0.5rem 0 0 0;
+    font-size: 0.9rem;
+    color: #666;
+}
+</style>
+"""
+
 def add_demo_css():
     """Enhanced CSS styling for demo presentation"""
-    st.markdown("""
-    <style>
-    .demo-header {
-        background: linear-gradient(135deg, #1e3c72 0%, #2a5298 50%, #3d5998 100%);
-        color: white;
-        padding: 2rem;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        text-align: center;
-        box-shadow: 0 8px 25px rgba(42, 82, 152, 0.3);
-    }
-    
-    .demo-subtitle {
-        font-size: 1.2rem;
-        margin: 1rem 0;
-        opacity: 0.9;
-    }
-    
-    .demo-stats {
-        display: flex;
-        justify-content: center;
-        gap: 3rem;
-        margin-top: 1.5rem;
-    }
-    
-    .demo-stat {
-        text-align: center;
-        background: rgba(255,255,255,0.1);
-        padding: 1rem;
-        border-radius: 10px;
-        backdrop-filter: blur(10px);
-    }
-    
-    .demo-stat .stat-number {
-        display: block;
-        font-size: 2rem;
-        font-weight: bold;
-        color: #fff;
-    }
-    
-    .demo-stat .stat-label {
-        font-size: 0.9rem;
-        opacity: 0.8;
-    }
-    
-    .demo-scenario {
-        background: #e3f2fd;
-        border: 1px solid #2196f3;
-        border-radius: 10px;
-        padding: 1.5rem;
-        margin-bottom: 2rem;
-    }
-    
-    .demo-scenario h3 {
-        color: #1565c0;
-        margin-top: 0;
-    }
-    
-    .demo-feature-card {
-        background: white;
-        border: 2px solid #e0e0e0;
-        border-radius: 12px;
-        padding: 1.5rem;
-        height: 100%;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-        transition: all 0.3s ease;
-    }
-    
-    .demo-feature-card:hover {
-        border-color: #2a5298;
-        box-shadow: 0 6px 20px rgba(42, 82, 152, 0.15);
-        transform: translateY(-2px);
-    }
-    
-    .feature-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 1rem;
-        padding-bottom: 1rem;
-        border-bottom: 2px solid #f0f0f0;
-    }
-    
-    .feature-header h2 {
-        margin: 0;
-        color: #1e3c72;
-        font-size: 1.4rem;
-    }
-    
-    .feature-badge {
-        background: #ff4757;
-        color: white;
-        padding: 0.3rem 0.8rem;
-        border-radius: 20px;
-        font-size: 0.8rem;
-        font-weight: bold;
-    }
-    
-    .feature-description ul {
-        margin: 1rem 0;
-        padding-left: 1.2rem;
-    }
-    
-    .feature-description li {
-        margin: 0.5rem 0;
-        color: #333;
-    }
-    
-    .demo-preview {
-        background: #f8f9fa;
-        border-left: 4px solid #2a5298;
-        padding: 1rem;
-        margin: 1rem 0;
-        border-radius: 0 8px 8px 0;
-    }
-    
-    .demo-preview.alert-style {
-        background: #fff3cd;
-        border-left-color: #ffc107;
-    }
-    
-    .quick-metrics {
-        display: flex;
-        justify-content: space-around;
-        margin-top: 1rem;
-        padding: 1rem;
-        background: #f8f9fa;
-        border-radius: 8px;
-    }
-    
-    .quick-metrics.alert-border {
-        border: 1px solid #ffc107;
-    }
-    
-    .metric-item {
-        text-align: center;
-    }
-    
-    .metric-item.inconsistent .metric-value {
-        color: #dc3545;
-    }
-    
-    .metric-item.consistent .metric-value {
-        color: #28a745;
-    }
-    
-    .metric-value {
-        display: block;
-        font-size: 1.8rem;
-        font-weight: bold;
-        color: #2a5298;
-    }
-    
-    .metric-name {
-        font-size: 0.9rem;
-        color: #666;
-    }
-    
-    .demo-guidance {
-        background: #fff;
-        border: 2px solid #28a745;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin-top: 2rem;
-    }
-    
-    .demo-guidance h3 {
-        color: #155724;
-        margin-top: 0;
-    }
-    
-    .demo-steps {
-        display: flex;
-        gap: 1rem;
-        flex-wrap: wrap;
-    }
-    
-    .step-item {
-        flex: 1;
-        min-width: 200px;
-        display: flex;
-        align-items: flex-start;
-        gap: 1rem;
-        background: #f8f9fa;
-        padding: 1rem;
-        border-radius: 8px;
-    }
-    
-    .step-number {
-        background: #28a745;
-        color: white;
-        width: 30px;
-        height: 30px;
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-weight: bold;
-        flex-shrink: 0;
-    }
-    
-    .step-content strong {
-        color: #155724;
-    }
-    
-    .step-content p {
-        margin: 0.5rem 0 0 0;
-        font-size: 0.9rem;
-        color: #666;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.html(_DEMO_CSS)
 
 # Update the main function to use the demo landing page
 def main():
@@ -1012,6 +1101,7 @@ def main():
         st.session_state.mindmap_generated = False
         st.session_state.mindmap_content = None
         st.session_state.mindmap_data = None
+        st.session_state.mindmap_stats = None
     
     if 'show_fullscreen' not in st.session_state:
         st.session_state.show_fullscreen = False
@@ -1021,7 +1111,11 @@ def main():
 
     # Handle modal states first
     if st.session_state.show_fullscreen and st.session_state.mindmap_content:
-        show_fullscreen_mindmap(st.session_state.mindmap_content, st.session_state.mindmap_data)
+        show_fullscreen_mindmap(
+            st.session_state.mindmap_content,
+            st.session_state.mindmap_data,
+            st.session_state.mindmap_stats
+        )
         return
     
     if st.session_state.show_facts_popup:
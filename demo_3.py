@@ -1,95 +1,109 @@
-import uuid
 import os
 import warnings
 import json
 import re
+import secrets
+import hashlib
+import orjson
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from pydantic import BaseModel, Field, model_validator
-from typing_extensions import Self
-from typing import List, Union, Dict, Optional
-from streamlit_markmap_local import markmap
+from typing import List, Union, Dict, Optional, NamedTuple
 
 class AuditMindMapWarning(Warning):
     """Warning for audit mind map generation failures"""
 
 # MODIFIED FUNCTIONS TO USE STATIC MARKDOWN FILE
 
+# The spinner only shows on a cache miss; repeat loads return without any UI chrome
+@st.cache_resource(show_spinner="Loading TechCorp policy analysis...")
 def load_static_mindmap() -> tuple:
-    """Load the pre-saved mindmap markdown file"""
+    """Load the pre-saved mindmap markdown file (once per process, shared read-only)"""
     mindmap_file = "mindmap_c67fffff.md"
     
     try:
         # Read the markdown content
-        with open(mindmap_file, 'r', encoding='utf-8') as file:
-            markdown_content = file.read()
+        with open(mindmap_file, 'rb') as file:
+            markdown_content = file.read().decode('utf-8')
         
         # Create mock audit data structure based on the markdown content
         audit_data = parse_markdown_to_audit_data(markdown_content)
         
-        return markdown_content, audit_data
+        return markdown_content, audit_data, compute_mindmap_stats(markdown_content, audit_data)
         
     except FileNotFoundError:
         # Fallback with the provided content if file not found
         markdown_content = """"""
         
         audit_data = parse_markdown_to_audit_data(markdown_content)
-        return markdown_content, audit_data
-
+        return markdown_content, audit_data, compute_mindmap_stats(markdown_content, audit_data)
+
+# One heading line of the static mind map: "#..#### <emoji> text" or "##### text"
+_HEADING_RE = re.compile(
+    r'^[^\S\n]*(?:#####[^\S\n]|(#{1,4})[^\S\n]+(🔍|📋|🎯|🔸))[^\S\n]*(.*?)[^\S\n]*$',
+    re.MULTILINE
+)
+
+# (heading hashes, emoji marker) -> node kind; "#####" content lines match neither group
+_HEADING_KINDS = {
+    ('#', '🔍'): 'title',
+    ('##', '📋'): 'document',
+    ('###', '🎯'): 'insight',
+    ('####', '🔸'): 'sub_title',
+    (None, None): 'sub_content',
+}
+
+@st.cache_data(show_spinner=False)
 def parse_markdown_to_audit_data(markdown_content: str) -> Dict:
     """Parse markdown content into audit data structure"""
-    lines = markdown_content.split('\n')
-    
-    # Extract title
-    unified_title = "Integrated Controls Framework Overview"
-    for line in lines:
-        if line.startswith('# 🔍'):
-            unified_title = line.replace('# 🔍', '').strip()
-            break
+    unified_title = None
     
-    # Parse documents and insights
+    # Parse title, documents and insights in a single pass
     documents = []
     current_doc = None
     current_insight = None
     
-    for line in lines:
-        line = line.strip()
-        if line.startswith('## 📋'):
+    for match in _HEADING_RE.finditer(markdown_content):
+        hashes, marker, text = match.groups()
+        kind = _HEADING_KINDS.get((hashes, marker))
+        
+        if kind is None:
+            continue
+        
+        elif kind == 'title':
+            # Extract title (first one wins)
+            if unified_title is None:
+                unified_title = text
+        
+        elif kind == 'document':
             # New document
             if current_doc:
                 documents.append(current_doc)
             current_doc = {
-                "document_id": str(uuid.uuid4())[:8],
-                "document_title": line.replace('## 📋', '').strip(),
+                "document_id": "",  # filled in below once the documents are counted
+                "document_title": text,
                 "document_type": "Policy Document",
                 "audit_insights": []
             }
             
-        elif line.startswith('### 🎯'):
+        elif kind == 'insight':
             # New insight
             if current_insight and current_doc:
                 current_doc["audit_insights"].append(current_insight)
             current_insight = {
-                "node_title": line.replace('### 🎯', '').strip(),
+                "node_title": text,
                 "sub_nodes": []
             }
             
-        elif line.startswith('#### 🔸'):
+        elif kind == 'sub_title':
             # Sub node title
             if current_insight:
-                sub_title = line.replace('#### 🔸', '').strip()
                 current_insight["sub_nodes"].append({
-                    "sub_title": sub_title,
+                    "sub_title": text,
                     "sub_content": ""
                 })
                 
-        elif line.startswith('##### ') and current_insight and current_insight["sub_nodes"]:
+        elif current_insight and current_insight["sub_nodes"]:
             # Sub node content
-            content = line.replace('#####', '').strip()
-            current_insight["sub_nodes"][-1]["sub_content"] = content
+            current_insight["sub_nodes"][-1]["sub_content"] = text
     
     # Add last insight and document
     if current_insight and current_doc:
@@ -97,26 +111,78 @@ def parse_markdown_to_audit_data(markdown_content: str) -> Dict:
     if current_doc:
         documents.append(current_doc)
     
+    # Draw random bytes for every document id in one call (8 hex chars each)
+    document_ids = secrets.token_hex(4 * len(documents))
+    for index, doc in enumerate(documents):
+        doc["document_id"] = document_ids[8 * index:8 * index + 8]
+    
     return {
-        "unified_title": unified_title,
+        "unified_title": unified_title or "Integrated Controls Framework Overview",
         "audit_context": "Comprehensive framework covering security, data governance, risk management and audit controls",
         "documents": documents
     }
 
+def compute_mindmap_stats(markdown_content: str, audit_data: Dict) -> Dict:
+    """Count the documents, insights, controls and words shown in the mind map stats"""
+    # Count insights and controls in one traversal
+    documents = audit_data.get("documents", ())
+    total_insights = 0
+    total_subnodes = 0
+    for doc in documents:
+        insights = doc.get("audit_insights", ())
+        total_insights += len(insights)
+        for insight in insights:
+            total_subnodes += len(insight.get("sub_nodes", ()))
+    
+    return {
+        "documents": len(documents),
+        "insights": total_insights,
+        "controls": total_subnodes,
+        "words": len(markdown_content.split()),
+    }
+
+@st.cache_data(show_spinner=False)
+def audit_data_to_json(audit_data: Dict) -> bytes:
+    """Serialize audit data as indented JSON for the export download"""
+    return orjson.dumps(audit_data, option=orjson.OPT_INDENT_2)
+
+@st.cache_data(show_spinner=False)
+def source_documents_to_json(source_docs: Dict) -> bytes:
+    """Serialize the source documents mapping as indented JSON for the export download"""
+    return orjson.dumps(source_docs, option=orjson.OPT_INDENT_2)
+
+@st.cache_data(show_spinner=False)
+def facts_data_to_json(facts_key, _data: Dict) -> bytes:
+    """Serialize the fact index for export, keyed on the file mtime or uploaded bytes"""
+    return orjson.dumps(_data, option=orjson.OPT_INDENT_2)
+
+def content_suffix(content: Union[str, bytes]) -> str:
+    """Short content hash used to keep download filenames stable across reruns"""
+    if isinstance(content, str):
+        content = content.encode()
+    return hashlib.blake2b(content, digest_size=4).hexdigest()
+
 def generate_audit_mindmap(documents: List[Dict] = None) -> Union[tuple, tuple]:
     """Generate audit-focused mind map using static markdown file"""
     try:
         # Ignore the documents parameter and use static content
-        markdown_content, audit_data = load_static_mindmap()
-        return markdown_content, audit_data
+        markdown_content, audit_data, mindmap_stats = load_static_mindmap()
+        return markdown_content, audit_data, mindmap_stats
         
     except Exception as e:
         warnings.warn(
             message=f"Static mind map loading failed: {e}",
             category=AuditMindMapWarning,
         )
-        return None, None
+        return None, None, None
 
+@st.cache_data(show_spinner=False)
+def get_document_content(path: str) -> str:
+    """Read a bundled fallback source document body"""
+    with open(path, 'r', encoding='utf-8') as file:
+        return file.read()
+
+@st.cache_data(show_spinner=False)
 def load_source_documents():
     """Load the source documents mapping from JSON file"""
     source_docs_file = "source_documents.json"
@@ -126,882 +192,284 @@ def load_source_documents():
             source_docs = json.load(file)
         return source_docs
     except FileNotFoundError:
-        # Fallback sample data for demo
-        return {
-                "security_policy.pdf": {
-                    "title": "Information Security Policy",
-                    "content": """
-        # Information Security Policy
-**Document Version:** 2.1  
-**Last Updated:** March 15, 2024  
-**Document Type:** Policy Document  
-**Approval Authority:** Chief Information Security Officer  
-**Review Cycle:** Annual  
-
-## 1. Executive Summary
-
-This Information Security Policy establishes comprehensive security controls across the organization to protect information assets, maintain business continuity, and ensure regulatory compliance. The policy framework encompasses access management, incident response, risk assessment, training, and data protection measures designed to safeguard organizational data and systems against evolving security threats.
-
-## 2. Policy Scope and Objectives
-
-### 2.1 Scope
-This policy applies to all employees, contractors, vendors, and third parties who access organizational information systems, data, or facilities. The policy covers all information assets regardless of format, location, or storage medium.
-
-### 2.2 Objectives
-- Establish robust access controls and authentication mechanisms
-- Implement effective incident response and recovery procedures
-- Maintain continuous risk assessment and vulnerability management
-- Ensure comprehensive security awareness and training programs
-- Protect sensitive data through classification and encryption standards
-
-## 3. Role-Based Access and Authentication Controls
-
-### 3.1 Role-Based Access Control (RBAC) Implementation
-All system access must be governed by role-based access control principles, ensuring users receive minimum necessary permissions based on job functions and business requirements.
-
-**Key Requirements:**
-- Access provisioning based on documented job roles and responsibilities
-- Segregation of duties for sensitive functions and processes
-- Regular review and validation of role definitions and permissions
-- Automated access provisioning where technically feasible
-
-### 3.2 Quarterly Access Reviews
-System owners must conduct comprehensive access reviews every quarter to validate user permissions and identify unauthorized or excessive access.
-
-**Review Process:**
-- Generate access reports for all systems under management
-- Validate each user's access against current job responsibilities
-- Document review findings and remediation actions
-- Submit completed reviews to Information Security within 10 business days
-
-### 3.3 Multi-Factor Authentication Requirements
-Multi-factor authentication (MFA) is mandatory for all privileged accounts and remote access scenarios to provide enhanced security for sensitive system access.
-
-**Implementation Standards:**
-- Deploy MFA for all administrative and privileged user accounts
-- Require MFA for all remote access connections including VPN
-- Utilize approved authentication factors: something you know, have, or are
-- Maintain backup authentication methods for business continuity
-
-## 4. Incident Response and Escalation Procedures
-
-### 4.1 Incident Classification and Response Times
-Security incidents are classified based on severity levels with corresponding response time requirements to ensure appropriate resource allocation and management attention.
-
-**Response Time Requirements:**
-- **Critical Incidents:** Initial response within 2 hours
-- **High Severity:** Initial response within 4 hours
-- **Medium Severity:** Initial response within 8 hours
-- **Low Severity:** Initial response within 24 hours
-
-### 4.2 Mandatory CISO Escalation
-All incidents involving personal data breaches or system compromise must be immediately escalated to the Chief Information Security Officer regardless of initial severity assessment.
-
-**Escalation Triggers:**
-- Unauthorized access to personal or confidential data
-- System compromise or malware infection
-- Denial of service attacks affecting business operations
-- Suspected insider threats or policy violations
-
-### 4.3 Centralized Incident Documentation
-All security incidents must be documented in the central incident management system to ensure proper tracking, analysis, and reporting capabilities.
-
-**Documentation Requirements:**
-- Incident discovery and initial assessment details
-- Response actions taken and personnel involved
-- Business impact assessment and affected systems
-- Root cause analysis and corrective action plans
-
-## 5. Risk Assessment and Vulnerability Management
-
-### 5.1 Annual Risk Assessments
-All critical systems must undergo comprehensive annual risk assessments to identify vulnerabilities, threats, and potential business impacts.
-
-**Assessment Components:**
-- Asset inventory and criticality classification
-- Threat landscape analysis and vulnerability identification
-- Risk calculation based on likelihood and impact
-- Control effectiveness evaluation and gap analysis
-- Executive reporting with risk treatment recommendations
-
-### 5.2 Monthly Vulnerability Scanning
-Automated vulnerability scanning must be performed monthly on all network-connected systems to identify security weaknesses and configuration issues.
-
-**Scanning Requirements:**
-- Authenticated scans for internal systems where possible
-- External perimeter scanning from internet perspective
-- Database and application-specific vulnerability assessments
-- Wireless network security assessments quarterly
-
-### 5.3 Critical Vulnerability Remediation
-Critical vulnerabilities must be remediated within 72 hours of identification to minimize exposure to potential attacks.
-
-**Remediation Process:**
-- Immediate notification to system owners and security team
-- Risk assessment and business impact analysis
-- Coordinated patching or compensating control implementation
-- Validation testing and vulnerability re-scan confirmation
-
-## 6. Security Awareness and Training Controls
-
-### 6.1 Annual Employee Training
-All employees must complete mandatory security awareness training annually to maintain current knowledge of security threats, policies, and procedures.
-
-**Training Components:**
-- Current threat landscape and attack methodologies
-- Organizational security policies and procedures
-- Incident reporting requirements and contact information
-- Data handling and protection best practices
-
-### 6.2 Specialized Privileged User Training
-Users with elevated system privileges must complete additional specialized training every six months due to increased security responsibilities and risk exposure.
-
-**Advanced Training Topics:**
-- Advanced persistent threat recognition and response
-- Secure system administration practices
-- Privileged access management and monitoring
-- Incident response procedures and forensic preservation
-
-### 6.3 Training Compliance Monitoring
-Training completion rates and compliance metrics are tracked and reported to management quarterly to ensure program effectiveness and identify areas for improvement.
-
-## 7. Data Classification and Encryption Standards
-
-### 7.1 Mandatory Data Classification
-All organizational information must be classified according to sensitivity levels to ensure appropriate protection measures are applied consistently.
-
-**Classification Levels:**
-- **Public:** Information approved for public disclosure
-- **Internal:** Information for internal organizational use
-- **Confidential:** Sensitive information requiring protection
-- **Restricted:** Highly sensitive information with strict access controls
-
-### 7.2 AES-256 Encryption Requirements
-All Confidential and Restricted data must be encrypted using AES-256 encryption standards both in transit and at rest to prevent unauthorized access.
-
-**Implementation Standards:**
-- Transport Layer Security (TLS) 1.3 for data in transit
-- Full disk encryption for endpoint devices and servers
-- Database-level encryption for sensitive data fields
-- Secure key management and rotation procedures
-        """,
-                    "type": "Policy Document",
-                    "last_updated": "2024-03-15",
-                    "version": "2.1"
-                },
-                "data_governance.pdf": {
-                    "title": "Data Governance Framework",
-                    "content": """
-        # Data Governance Framework
-**Document Version:** 3.0  
-**Last Updated:** February 28, 2024  
-**Document Type:** Framework Document  
-**Approval Authority:** Chief Data Officer  
-**Review Cycle:** Annual  
-
-## 1. Executive Summary
-
-The Data Governance Framework establishes comprehensive accountability structures for data quality, privacy, and lifecycle management across all business units. This framework ensures data assets are properly managed, protected, and leveraged to support business objectives while maintaining compliance with privacy regulations and organizational policies.
-
-## 2. Framework Scope and Principles
-
-### 2.1 Scope
-This framework applies to all data assets across the organization, including structured and unstructured data, regardless of storage location, format, or business application.
-
-### 2.2 Governance Principles
-- Data is a strategic organizational asset requiring active management
-- Clear accountability and stewardship roles for all data domains
-- Privacy by design in all data processing activities
-- Data quality drives business value and decision-making effectiveness
-- Lifecycle management from creation to secure destruction
-
-## 3. Data Stewardship Roles and Accountability
-
-### 3.1 Business Data Owner Responsibilities
-Business data owners are accountable for data quality, access decisions, and business value realization within their respective domains.
-
-**Primary Responsibilities:**
-- Define data quality standards and acceptance criteria
-- Make access authorization decisions based on business need
-- Approve data sharing agreements and usage policies
-- Participate in data governance committee activities
-- Ensure compliance with privacy and regulatory requirements
-
-### 3.2 Technical Data Custodian Duties
-Technical data custodians implement and maintain security controls, backup procedures, and technical infrastructure as directed by data owners.
-
-**Core Functions:**
-- Implement technical security controls and access mechanisms
-- Maintain data backup and recovery capabilities
-- Monitor data usage and access patterns
-- Execute data lifecycle management procedures
-- Provide technical expertise for data governance initiatives
-
-### 3.3 Data Governance Committee Structure
-Cross-functional data governance committees provide oversight and decision-making authority for enterprise data management initiatives.
-
-**Committee Composition:**
-- Executive sponsor from senior leadership
-- Business data owners from each major domain
-- Technical representatives from IT and security
-- Privacy officer and legal counsel
-- Data quality and analytics representatives
-
-## 4. GDPR Compliance and Privacy Controls
-
-### 4.1 Lawful Basis Documentation
-All personal data processing activities must have documented lawful basis under GDPR with regular review and validation procedures.
-
-**Documentation Requirements:**
-- Clear identification of applicable lawful basis
-- Purpose limitation and data minimization assessment
-- Data subject notification and consent mechanisms where required
-- Regular review of processing necessity and proportionality
-
-### 4.2 Privacy Impact Assessments
-High-risk personal data processing activities require comprehensive privacy impact assessments before implementation.
-
-**Assessment Triggers:**
-- Large-scale systematic monitoring of public areas
-- Processing of special category personal data
-- Automated decision-making with legal or significant effects
-- Data processing involving vulnerable individuals
-
-### 4.3 Data Subject Rights Management
-Data subject rights requests must be fulfilled within 30 days with documented evidence of completion and appropriate record-keeping.
-
-**Rights Management Process:**
-- Centralized request intake and tracking system
-- Identity verification procedures for requesters
-- Cross-system data location and extraction capabilities
-- Response documentation and audit trail maintenance
-
-## 5. Data Retention and Legal Hold Procedures
-
-### 5.1 Comprehensive Retention Schedules
-Retention schedules are established for all data categories based on business requirements, regulatory obligations, and risk considerations.
-
-**Schedule Components:**
-- Business justification for retention periods
-- Regulatory and legal requirement analysis
-- Storage cost and risk assessment
-- Disposal method and certification requirements
-
-### 5.2 Automated Deletion Implementation
-Automated deletion processes are implemented where technically feasible to ensure consistent application of retention policies.
-
-**Automation Capabilities:**
-- Database triggers for record-level deletion
-- File system monitoring and automated purging
-- Application-integrated retention management
-- Exception handling and manual review processes
-
-### 5.3 Legal Hold Override Procedures
-Legal hold procedures override standard retention schedules during litigation, regulatory investigation, or audit scenarios.
-
-**Hold Management:**
-- Legal hold notification and acknowledgment process
-- System-wide hold implementation and monitoring
-- Regular hold review and release procedures
-- Documentation of hold decisions and scope
-
-## 6. Data Quality Monitoring and Master Data Management
-
-### 6.1 Automated Data Profiling
-Continuous data quality monitoring through automated profiling identifies quality issues and trends across all data domains.
-
-**Profiling Metrics:**
-- Completeness, accuracy, and consistency measurements
-- Data freshness and timeliness indicators
-- Referential integrity and constraint violations
-- Statistical anomaly detection and trending
-
-### 6.2 Monthly Quality Scorecards
-Quality scorecards are published monthly to data owners providing visibility into data quality performance and improvement opportunities.
-
-**Scorecard Elements:**
-- Overall quality scores by data domain and system
-- Trend analysis and performance indicators
-- Issue identification and remediation status
-- Benchmark comparisons and improvement targets
-
-### 6.3 Master Data Management
-Master data management processes ensure single source of truth for critical data entities across all business applications.
-
-**MDM Capabilities:**
-- Golden record creation and maintenance
-- Data matching and deduplication processes
-- Change control and approval workflows
-- Distribution and synchronization mechanisms
-        """,
-                    "type": "Framework Document",
-                    "last_updated": "2024-02-28",
-                    "version": "3.0"
-                },
-                "vendor_management.pdf": {
-                    "title": "Third-Party Risk Management Policy",
-                    "content": """
-        # Third-Party Risk Management Policy
-**Document Version:** 1.8  
-**Last Updated:** January 20, 2024  
-**Document Type:** Risk Management Policy  
-**Approval Authority:** Chief Risk Officer  
-**Review Cycle:** Annual  
-
-## 1. Executive Summary
-
-The Third-Party Risk Management Policy establishes comprehensive procedures for assessing, monitoring, and managing risks associated with vendors and service providers. This policy ensures organizational data and systems remain protected when accessed or processed by external parties while maintaining business continuity and regulatory compliance.
-
-## 2. Policy Scope and Risk Categories
-
-### 2.1 Policy Scope
-This policy applies to all third-party relationships involving access to organizational data, systems, facilities, or services that could impact business operations or security posture.
-
-### 2.2 Risk Categories
-- **Cyber Security:** Data breaches, system compromise, and security control deficiencies
-- **Operational:** Service disruptions, performance failures, and business continuity risks
-- **Compliance:** Regulatory violations, policy non-compliance, and audit findings
-- **Financial:** Credit risk, pricing changes, and financial stability concerns
-- **Reputational:** Public relations impacts and brand damage from vendor incidents
-
-## 3. Vendor Risk Assessment and Onboarding
-
-### 3.1 Pre-Contract Risk Assessment
-All vendors must undergo comprehensive risk assessment before contract execution using standardized questionnaires and risk scoring methodology.
-
-**Assessment Components:**
-- Security control maturity and effectiveness evaluation
-- Financial stability and business continuity capabilities
-- Regulatory compliance and certification status
-- References and past performance validation
-- Geographic and jurisdictional risk considerations
-
-### 3.2 Risk Scoring and Classification
-Vendors are classified based on risk scores and criticality to business operations to determine appropriate oversight and monitoring requirements.
-
-**Classification Levels:**
-- **Critical:** Essential services with high risk exposure
-- **Important:** Significant business impact with moderate risk
-- **Standard:** Limited impact with standard risk profile
-- **Low:** Minimal impact with basic risk considerations
-
-### 3.3 Annual On-Site Security Assessments
-Critical vendors undergo annual on-site security assessments conducted by qualified security professionals to validate control implementation and effectiveness.
-
-**Assessment Scope:**
-- Physical security controls and environmental protections
-- Technical security architecture and monitoring capabilities
-- Personnel security practices and access management
-- Incident response procedures and business continuity plans
-
-## 4. Contractual Security and Data Protection
-
-### 4.1 Mandatory Security Requirements
-All vendor contracts must include comprehensive security requirements, right to audit clauses, and incident notification obligations.
-
-**Contract Provisions:**
-- Minimum security control standards and implementation requirements
-- Regular security assessment and audit rights
-- Incident notification timelines and escalation procedures
-- Data protection and privacy requirement compliance
-
-### 4.2 Data Processing Agreements
-Vendors processing personal data on behalf of the organization must execute data processing agreements compliant with applicable privacy regulations.
-
-**Agreement Components:**
-- Processing purpose limitations and data minimization requirements
-- Data subject rights support and assistance obligations
-- International data transfer safeguards and restrictions
-- Sub-processor approval and oversight requirements
-
-### 4.3 Service Level Agreements
-Performance expectations and measurement criteria are documented in service level agreements with penalties for non-compliance.
-
-**SLA Elements:**
-- Availability and performance benchmarks
-- Response time requirements for issues and requests
-- Quality metrics and measurement methodologies
-- Penalty structures and remediation procedures
-
-## 5. Ongoing Vendor Monitoring and Performance Management
-
-### 5.1 Quarterly Business Reviews
-Critical vendors participate in quarterly business reviews to assess performance, address issues, and plan future requirements.
-
-**Review Topics:**
-- Performance against established service levels
-- Security incident summary and lessons learned
-- Business relationship satisfaction and improvement opportunities
-- Technology roadmap alignment and future planning
-
-### 5.2 Annual Security Questionnaire Updates
-All vendors must complete updated security questionnaires annually to maintain current risk assessment information.
-
-**Questionnaire Updates:**
-- Changes to security controls and certifications
-- New regulatory compliance requirements
-- Incident history and response improvements
-- Business continuity and disaster recovery capabilities
-
-### 5.3 Continuous Monitoring Program
-Automated monitoring tools and manual review processes provide ongoing visibility into vendor risk posture and performance.
-
-**Monitoring Components:**
-- Security rating services and threat intelligence feeds
-- Financial stability monitoring and credit assessments
-- Regulatory compliance and certification tracking
-- News and media monitoring for reputation risks
-
-## 6. Vendor Access Management and Termination
-
-### 6.1 Access Control Requirements
-All vendor personnel accessing organizational systems must have unique identities with access regularly reviewed and certified by business owners.
-
-**Access Management:**
-- Individual user accounts with strong authentication
-- Role-based access aligned with job responsibilities
-- Regular access reviews and recertification procedures
-- Privileged access monitoring and session recording
-
-### 6.2 Secure Termination Procedures
-Vendor termination procedures ensure secure return or destruction of organizational data with appropriate certification and validation.
-
-**Termination Activities:**
-- Immediate access revocation across all systems
-- Data return or certified destruction verification
-- Final security assessment and clearance procedures
-- Transition planning and knowledge transfer requirements
-
-### 6.3 Business Continuity Planning
-Critical vendor dependencies are assessed with documented contingency plans for vendor failure scenarios and alternative service providers.
-
-**Continuity Planning:**
-- Single points of failure identification and mitigation
-- Alternative vendor identification and qualification
-- Transition procedures and timeline development
-- Regular testing and plan validation exercises
-        """,
-                    "type": "Risk Management Policy",
-                    "last_updated": "2024-01-20",
-                    "version": "1.8"
-                },
-                "internal_audit.pdf": {
-                    "title": "Internal Audit Charter",
-                    "content": """
-        # Internal Audit Charter
-**Document Version:** 2.3  
-**Last Updated:** April 10, 2024  
-**Document Type:** Charter Document  
-**Approval Authority:** Board Audit Committee  
-**Review Cycle:** Annual  
-
-## 1. Executive Summary
-
-The Internal Audit Charter establishes the purpose, authority, and responsibility of the internal audit function within the organization's governance structure. This charter ensures audit independence, defines comprehensive audit scope, and establishes quality standards that enable effective risk management, control evaluation, and governance process improvement.
-
-## 2. Charter Purpose and Mission
-
-### 2.1 Internal Audit Mission
-To enhance and protect organizational value by providing risk-based and objective assurance, advice, and insight to management and the board of directors.
-
-### 2.2 Charter Authority
-This charter is established by the Board of Directors and defines the internal audit function's purpose, authority, and responsibility within the organization's governance framework.
-
-### 2.3 Organizational Independence
-Internal audit maintains organizational independence through dual reporting relationships and unrestricted access to information, personnel, and systems necessary to fulfill audit responsibilities.
-
-## 3. Audit Independence and Reporting Structure
-
-### 3.1 Functional Reporting to Audit Committee
-Internal audit reports functionally to the Audit Committee of the Board of Directors to ensure independence and objectivity in audit activities.
-
-**Functional Reporting Responsibilities:**
-- Annual audit plan approval and significant changes
-- Audit results communication and management responses
-- Resource adequacy assessment and budget approval
-- Chief Audit Executive performance evaluation and compensation
-
-### 3.2 Administrative Reporting to CEO
-Internal audit reports administratively to the Chief Executive Officer for day-to-day operations and resource management.
-
-**Administrative Responsibilities:**
-- Daily operational management and resource allocation
-- Staff hiring, performance evaluation, and development
-- Coordination with management and other assurance providers
-- Administrative policy compliance and implementation
-
-### 3.3 Independence Safeguards
-Specific safeguards ensure audit independence and objectivity are maintained throughout all audit activities.
-
-**Safeguard Mechanisms:**
-- Direct board access without management present
-- Prohibition from operational responsibilities and decision-making
-- Rotation of audit staff on long-term engagements
-- Annual independence confirmation and conflict disclosure
-
-## 4. Comprehensive Audit Scope and Authority
-
-### 4.1 Unlimited Audit Scope
-Internal audit scope includes evaluation of risk management, control, and governance processes across all organizational activities, systems, and functions.
-
-**Audit Coverage Areas:**
-- Financial and operational process effectiveness
-- Information technology systems and cybersecurity controls
-- Regulatory compliance and ethics program effectiveness
-- Risk management framework and control environment
-
-### 4.2 Unrestricted Access Rights
-No restrictions are placed on internal audit access to records, personnel, or physical properties relevant to audit objectives.
-
-**Access Rights Include:**
-- All organizational records, documents, and information systems
-- Personnel interviews and facility inspections
-- External party communications and contract documentation
-- Board and senior management meeting observations
-
-### 4.3 Authority Limitations
-Internal audit does not have authority to direct operational activities, make management decisions, or implement corrective actions.
-
-**Prohibited Activities:**
-- Operational decision-making or process ownership
-- Implementation of controls or corrective actions
-- Approval of transactions or operational procedures
-- Direct responsibility for control design or maintenance
-
-## 5. Risk-Based Audit Planning and Methodology
-
-### 5.1 Risk Assessment Methodology
-Internal audit utilizes comprehensive risk assessment methodology to prioritize audit activities based on organizational risk exposure and strategic objectives.
-
-**Risk Assessment Components:**
-- Business process and system risk evaluation
-- Management concerns and regulatory requirements
-- Previous audit results and external examination findings
-- Industry risks and emerging threat considerations
-
-### 5.2 Annual Audit Plan Development
-The annual audit plan is developed through systematic risk assessment and stakeholder input with approval by the Audit Committee.
-
-**Planning Process:**
-- Enterprise risk assessment and audit universe update
-- Stakeholder input collection and priority setting
-- Resource requirement analysis and capacity planning
-- Quarterly plan updates and adjustment procedures
-
-### 5.3 Audit Engagement Management
-Individual audit engagements follow structured methodology ensuring consistent quality and comprehensive coverage.
-
-**Engagement Phases:**
-- Planning and risk assessment with scope definition
-- Fieldwork execution and testing procedures
-- Finding development and recommendation formulation
-- Report preparation and management response coordination
-
-## 6. Professional Standards and Quality Assurance
-
-### 6.1 IIA Standards Compliance
-All internal audit activities comply with Institute of Internal Auditors International Professional Practices Framework standards.
-
-**Standards Implementation:**
-- Attribute standards for audit function characteristics
-- Performance standards for audit activity management
-- Implementation guidance and practice advisory adoption
-- Ethics code compliance and professional conduct requirements
-
-### 6.2 External Quality Assessment Program
-External quality assessments are conducted every five years by qualified independent reviewers to evaluate audit effectiveness and standards compliance.
-
-**Assessment Scope:**
-- Conformance with professional standards and best practices
-- Audit methodology effectiveness and quality indicators
-- Organizational independence and objectivity maintenance
-- Value-added services and stakeholder satisfaction
-
-### 6.3 Continuous Professional Development
-Internal audit staff maintain professional competency through certification maintenance and continuing education requirements.
-
-**Development Requirements:**
-- Professional certification achievement and maintenance
-- Annual continuing education hour completion
-- Technical and industry training participation
-- Internal knowledge sharing and best practice development
-
-## 7. Audit Communication and Follow-Up
-
-### 7.1 Audit Reporting Standards
-Audit findings are communicated through formal written reports with clear findings, recommendations, and management responses.
-
-**Report Components:**
-- Executive summary with overall assessment and key findings
-- Detailed findings with risk ratings and recommendations
-- Management responses with action plans and target dates
-- Implementation timeline and resource requirement documentation
-
-### 7.2 Follow-Up Procedures
-Systematic follow-up procedures verify timely implementation of agreed-upon management actions and assess remediation effectiveness.
-
-**Follow-Up Process:**
-- Quarterly status reporting on open audit recommendations
-- Independent validation of completed corrective actions
-- Risk assessment for overdue or incomplete responses
-- Escalation procedures for persistent non-compliance
-
-### 7.3 Communication with External Parties
-Coordination with external auditors, regulators, and other oversight bodies ensures efficient audit coverage and minimizes duplication.
-
-**External Coordination:**
-- Audit plan sharing and coverage mapping
-- Findings communication and remediation coordination
-- Regulatory examination support and liaison activities
-- Professional development and best practice sharing
-        """,
-                    "type": "Charter Document",
-                    "last_updated": "2024-04-10",
-                    "version": "2.3"
-                }
+        # Fallback sample data for demo; each document body lives under docs/ and
+        # is only read once the document mapping is first needed
+        source_docs = {
+            "security_policy.pdf": {
+                "title": "Information Security Policy",
+                "content": get_document_content("docs/security_policy.md"),
+                "type": "Policy Document",
+                "last_updated": "2024-03-15",
+                "version": "2.1"
+            },
+            "data_governance.pdf": {
+                "title": "Data Governance Framework",
+                "content": get_document_content("docs/data_governance.md"),
+                "type": "Framework Document",
+                "last_updated": "2024-02-28",
+                "version": "3.0"
+            },
+            "vendor_management.pdf": {
+                "title": "Third-Party Risk Management Policy",
+                "content": get_document_content("docs/vendor_management.md"),
+                "type": "Risk Management Policy",
+                "last_updated": "2024-01-20",
+                "version": "1.8"
+            },
+            "internal_audit.pdf": {
+                "title": "Internal Audit Charter",
+                "content": get_document_content("docs/internal_audit.md"),
+                "type": "Charter Document",
+                "last_updated": "2024-04-10",
+                "version": "2.3"
             }
+        }
+        return source_docs
+
+# Modal CSS for the fullscreen mind map and its source document panels (built once)
+_FULLSCREEN_CSS = """
+<style>
+.mindmap-modal {
+    position: fixed;
+    z-index: 999999;
+    left: 0;
+    top: 0;
+    width: 100%;
+    height: 100%;
+    background-color: rgba(0,0,0,0.8);
+    display: flex;
+    justify-content: center;
+    align-items: center;
+}
+
+.mindmap-modal-content {
+    background-color: #ffffff;
+    width: 98vw;
+    height: 98vh;
+    border-radius: 12px;
+    position: relative;
+    display: flex;
+    flex-direction: column;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.3);
+}
+
+.mindmap-header {
+    background: linear-gradient(90deg, #1e3c72 0%, #2a5298 100%);
+    color: white;
+    padding: 1rem 2rem;
+    border-radius: 12px 12px 0 0;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    font-size: 1.2rem;
+    font-weight: bold;
+    flex-shrink: 0;
+}
+
+.mindmap-body {
+    flex: 1;
+    display: flex;
+    overflow: hidden;
+    background: #f8f9fa;
+}
+
+.mindmap-main-content {
+    flex: 2;
+    display: flex;
+    flex-direction: column;
+    padding: 1rem;
+    overflow: auto;
+}
+
+.source-docs-panel {
+    flex: 1;
+    background: white;
+    border-left: 2px solid #e0e0e0;
+    padding: 1rem;
+    overflow-y: auto;
+    max-width: 400px;
+    height: 100%;
+}
+
+.source-docs-header {
+    background: #f8f9fa;
+    padding: 0.75rem 1rem;
+    border-radius: 8px;
+    margin-bottom: 1rem;
+    border-left: 4px solid #2a5298;
+    position: sticky;
+    top: 0;
+    z-index: 10;
+}
+
+.source-doc-item {
+    background: white;
+    border: 1px solid #e0e0e0;
+    border-radius: 8px;
+    margin-bottom: 1rem;
+    overflow: hidden;
+    transition: all 0.3s ease;
+}
+
+.source-doc-item:hover {
+    border-color: #2a5298;
+    box-shadow: 0 2px 8px rgba(42, 82, 152, 0.15);
+}
+
+.source-doc-header {
+    background: #f8f9fa;
+    padding: 0.75rem;
+    border-bottom: 1px solid #e0e0e0;
+    cursor: pointer;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    position: sticky;
+    top: 0;
+    z-index: 5;
+}
+
+.source-doc-title {
+    font-weight: bold;
+    color: #1e3c72;
+    font-size: 0.9rem;
+}
+
+.source-doc-type {
+    background: #e3f2fd;
+    color: #1565c0;
+    padding: 0.2rem 0.5rem;
+    border-radius: 12px;
+    font-size: 0.7rem;
+}
+
+/* NEW: Scrollable content container for each document */
+.source-doc-content-container {
+    max-height: 300px;
+    overflow-y: auto;
+    border-top: 1px solid #f0f0f0;
+}
+
+.source-doc-content {
+    padding: 0.75rem;
+    font-size: 0.85rem;
+    line-height: 1.4;
+    color: #333;
+    white-space: pre-wrap;
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+}
+
+.source-doc-meta {
+    padding: 0.5rem 0.75rem;
+    background: #fafafa;
+    font-size: 0.75rem;
+    color: #666;
+    border-top: 1px solid #f0f0f0;
+    position: sticky;
+    bottom: 0;
+}
+
+/* Custom scrollbar styling */
+.source-doc-content-container::-webkit-scrollbar {
+    width: 6px;
+}
+
+.source-doc-content-container::-webkit-scrollbar-track {
+    background: #f1f1f1;
+    border-radius: 3px;
+}
+
+.source-doc-content-container::-webkit-scrollbar-thumb {
+    background: #c1c1c1;
+    border-radius: 3px;
+}
+
+.source-doc-content-container::-webkit-scrollbar-thumb:hover {
+    background: #a8a8a8;
+}
+
+.source-docs-panel::-webkit-scrollbar {
+    width: 8px;
+}
+
+.source-docs-panel::-webkit-scrollbar-track {
+    background: #f1f1f1;
+    border-radius: 4px;
+}
+
+.source-docs-panel::-webkit-scrollbar-thumb {
+    background: #c1c1c1;
+    border-radius: 4px;
+}
+
+.source-docs-panel::-webkit-scrollbar-thumb:hover {
+    background: #a8a8a8;
+}
+
+.mindmap-stats {
+    display: flex;
+    gap: 2rem;
+    margin-bottom: 1rem;
+    padding: 1rem;
+    background: white;
+    border-radius: 8px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    flex-shrink: 0;
+}
+
+.stat-item {
+    text-align: center;
+}
+
+.stat-number {
+    font-size: 2rem;
+    font-weight: bold;
+    color: #2a5298;
+    display: block;
+}
+
+.stat-label {
+    font-size: 0.9rem;
+    color: #666;
+    margin-top: 0.25rem;
+}
+
+.mindmap-container-fullscreen {
+    background: white;
+    border-radius: 8px;
+    flex: 1;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    overflow: hidden;
+}
+
+.action-buttons {
+    padding: 1rem 2rem;
+    background: white;
+    border-top: 1px solid #e0e0e0;
+    flex-shrink: 0;
+}
+
+/* Expand/Collapse indicator */
+.expand-indicator {
+    font-size: 0.8rem;
+    color: #666;
+    transition: transform 0.3s ease;
+}
+
+.expand-indicator.expanded {
+    transform: rotate(90deg);
+}
+</style>
+"""
 
 # Modified show_fullscreen_mindmap function
 # Updated show_fullscreen_mindmap function with scrollable document panels
 
-def show_fullscreen_mindmap(mindmap_content: str, audit_data: Dict):
+def show_fullscreen_mindmap(mindmap_content: str, audit_data: Dict, mindmap_stats: Dict):
     """Display fullscreen mind map modal with scrollable source documents"""
     
     # Enhanced Modal CSS styling with individual document scrollers
-    st.markdown("""
-    <style>
-    .mindmap-modal {
-        position: fixed;
-        z-index: 999999;
-        left: 0;
-        top: 0;
-        width: 100%;
-        height: 100%;
-        background-color: rgba(0,0,0,0.8);
-        display: flex;
-        justify-content: center;
-        align-items: center;
-    }
-    
-    .mindmap-modal-content {
-        background-color: #ffffff;
-        width: 98vw;
-        height: 98vh;
-        border-radius: 12px;
-        position: relative;
-        display: flex;
-        flex-direction: column;
-        box-shadow: 0 10px 30px rgba(0,0,0,0.3);
-    }
-    
-    .mindmap-header {
-        background: linear-gradient(90deg, #1e3c72 0%, #2a5298 100%);
-        color: white;
-        padding: 1rem 2rem;
-        border-radius: 12px 12px 0 0;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        font-size: 1.2rem;
-        font-weight: bold;
-        flex-shrink: 0;
-    }
-    
-    .mindmap-body {
-        flex: 1;
-        display: flex;
-        overflow: hidden;
-        background: #f8f9fa;
-    }
-    
-    .mindmap-main-content {
-        flex: 2;
-        display: flex;
-        flex-direction: column;
-        padding: 1rem;
-        overflow: auto;
-    }
-    
-    .source-docs-panel {
-        flex: 1;
-        background: white;
-        border-left: 2px solid #e0e0e0;
-        padding: 1rem;
-        overflow-y: auto;
-        max-width: 400px;
-        height: 100%;
-    }
-    
-    .source-docs-header {
-        background: #f8f9fa;
-        padding: 0.75rem 1rem;
-        border-radius: 8px;
-        margin-bottom: 1rem;
-        border-left: 4px solid #2a5298;
-        position: sticky;
-        top: 0;
-        z-index: 10;
-    }
-    
-    .source-doc-item {
-        background: white;
-        border: 1px solid #e0e0e0;
-        border-radius: 8px;
-        margin-bottom: 1rem;
-        overflow: hidden;
-        transition: all 0.3s ease;
-    }
-    
-    .source-doc-item:hover {
-        border-color: #2a5298;
-        box-shadow: 0 2px 8px rgba(42, 82, 152, 0.15);
-    }
-    
-    .source-doc-header {
-        background: #f8f9fa;
-        padding: 0.75rem;
-        border-bottom: 1px solid #e0e0e0;
-        cursor: pointer;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        position: sticky;
-        top: 0;
-        z-index: 5;
-    }
-    
-    .source-doc-title {
-        font-weight: bold;
-        color: #1e3c72;
-        font-size: 0.9rem;
-    }
-    
-    .source-doc-type {
-        background: #e3f2fd;
-        color: #1565c0;
-        padding: 0.2rem 0.5rem;
-        border-radius: 12px;
-        font-size: 0.7rem;
-    }
-    
-    /* NEW: Scrollable content container for each document */
-    .source-doc-content-container {
-        max-height: 300px;
-        overflow-y: auto;
-        border-top: 1px solid #f0f0f0;
-    }
-    
-    .source-doc-content {
-        padding: 0.75rem;
-        font-size: 0.85rem;
-        line-height: 1.4;
-        color: #333;
-        white-space: pre-wrap;
-        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-    }
-    
-    .source-doc-meta {
-        padding: 0.5rem 0.75rem;
-        background: #fafafa;
-        font-size: 0.75rem;
-        color: #666;
-        border-top: 1px solid #f0f0f0;
-        position: sticky;
-        bottom: 0;
-    }
-    
-    /* Custom scrollbar styling */
-    .source-doc-content-container::-webkit-scrollbar {
-        width: 6px;
-    }
-    
-    .source-doc-content-container::-webkit-scrollbar-track {
-        background: #f1f1f1;
-        border-radius: 3px;
-    }
-    
-    .source-doc-content-container::-webkit-scrollbar-thumb {
-        background: #c1c1c1;
-        border-radius: 3px;
-    }
-    
-    .source-doc-content-container::-webkit-scrollbar-thumb:hover {
-        background: #a8a8a8;
-    }
-    
-    .source-docs-panel::-webkit-scrollbar {
-        width: 8px;
-    }
-    
-    .source-docs-panel::-webkit-scrollbar-track {
-        background: #f1f1f1;
-        border-radius: 4px;
-    }
-    
-    .source-docs-panel::-webkit-scrollbar-thumb {
-        background: #c1c1c1;
-        border-radius: 4px;
-    }
-    
-    .source-docs-panel::-webkit-scrollbar-thumb:hover {
-        background: #a8a8a8;
-    }
-    
-    .mindmap-stats {
-        display: flex;
-        gap: 2rem;
-        margin-bottom: 1rem;
-        padding: 1rem;
-        background: white;
-        border-radius: 8px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        flex-shrink: 0;
-    }
-    
-    .stat-item {
-        text-align: center;
-    }
-    
-    .stat-number {
-        font-size: 2rem;
-        font-weight: bold;
-        color: #2a5298;
-        display: block;
-    }
-    
-    .stat-label {
-        font-size: 0.9rem;
-        color: #666;
-        margin-top: 0.25rem;
-    }
-    
-    .mindmap-container-fullscreen {
-        background: white;
-        border-radius: 8px;
-        flex: 1;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        overflow: hidden;
-    }
-    
-    .action-buttons {
-        padding: 1rem 2rem;
-        background: white;
-        border-top: 1px solid #e0e0e0;
-        flex-shrink: 0;
-    }
-    
-    /* Expand/Collapse indicator */
-    .expand-indicator {
-        font-size: 0.8rem;
-        color: #666;
-        transition: transform 0.3s ease;
-    }
-    
-    .expand-indicator.expanded {
-        transform: rotate(90deg);
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.html(_FULLSCREEN_CSS)
     
     # Load source documents
     source_docs = load_source_documents()
@@ -1031,36 +499,30 @@ def show_fullscreen_mindmap(mindmap_content: str, audit_data: Dict):
         with main_col:
             st.markdown('<div class="mindmap-main-content">', unsafe_allow_html=True)
             
-            # Statistics section
-            total_insights = sum(len(doc.get("audit_insights", [])) for doc in audit_data.get("documents", []))
-            total_subnodes = sum(
-                len(insight.get("sub_nodes", [])) 
-                for doc in audit_data.get("documents", []) 
-                for insight in doc.get("audit_insights", [])
-            )
-            
+            # Statistics section (precomputed when the mind map was loaded)
             st.markdown(f"""
             <div class="mindmap-stats">
                 <div class="stat-item">
-                    <span class="stat-number">{len(audit_data.get("documents", []))}</span>
+                    <span class="stat-number">{mindmap_stats["documents"]}</span>
                     <div class="stat-label">Documents</div>
                 </div>
                 <div class="stat-item">
-                    <span class="stat-number">{total_insights}</span>
+                    <span class="stat-number">{mindmap_stats["insights"]}</span>
                     <div class="stat-label">Insights</div>
                 </div>
                 <div class="stat-item">
-                    <span class="stat-number">{total_subnodes}</span>
+                    <span class="stat-number">{mindmap_stats["controls"]}</span>
                     <div class="stat-label">Controls</div>
                 </div>
                 <div class="stat-item">
-                    <span class="stat-number">{len(mindmap_content.split())}</span>
+                    <span class="stat-number">{mindmap_stats["words"]}</span>
                     <div class="stat-label">Words</div>
                 </div>
             </div>
             """, unsafe_allow_html=True)
             
-            # Mind map container
+            # Mind map container (component imported on first render only)
+            from streamlit_markmap_local import markmap
             st.markdown('<div class="mindmap-container-fullscreen">', unsafe_allow_html=True)
             markmap(mindmap_content, height=500)
             st.markdown('</div>', unsafe_allow_html=True)
@@ -1147,34 +609,33 @@ def show_fullscreen_mindmap(mindmap_content: str, audit_data: Dict):
         col1, col2, col3, col4, col5 = st.columns([1, 1, 1, 1, 2])
         
         with col1:
-            if st.button("💾 Export MD", use_container_width=True):
-                st.download_button(
-                    "📥 Download",
-                    mindmap_content,
-                    f"mindmap_{uuid.uuid4().hex[:8]}.md",
-                    "text/markdown",
-                    use_container_width=True
-                )
+            st.download_button(
+                "💾 Export MD",
+                mindmap_content,
+                f"mindmap_{content_suffix(mindmap_content)}.md",
+                "text/markdown",
+                use_container_width=True
+            )
         
         with col2:
-            if st.button("📊 Export JSON", use_container_width=True):
-                st.download_button(
-                    "📥 Download",
-                    json.dumps(audit_data, indent=2),
-                    f"mindmap_data_{uuid.uuid4().hex[:8]}.json",
-                    "application/json",
-                    use_container_width=True
-                )
+            payload = audit_data_to_json(audit_data)
+            st.download_button(
+                "📊 Export JSON",
+                payload,
+                f"mindmap_data_{content_suffix(payload)}.json",
+                "application/json",
+                use_container_width=True
+            )
         
         with col3:
-            if st.button("📄 Export Sources", use_container_width=True):
-                st.download_button(
-                    "📥 Download",
-                    json.dumps(source_docs, indent=2),
-                    f"source_documents_{uuid.uuid4().hex[:8]}.json",
-                    "application/json",
-                    use_container_width=True
-                )
+            payload = source_documents_to_json(source_docs)
+            st.download_button(
+                "📄 Export Sources",
+                payload,
+                f"source_documents_{content_suffix(payload)}.json",
+                "application/json",
+                use_container_width=True
+            )
         
         with col4:
             if st.button("🔄 Regenerate", use_container_width=True):
@@ -1202,17 +663,26 @@ def show_fullscreen_mindmap(mindmap_content: str, audit_data: Dict):
         """, unsafe_allow_html=True)
 
 
+# Policy fields that are checked for conflicting values across documents
+_INCONSISTENT_KEYS = frozenset({
+    'security_training_frequency',
+    'information_security_risk_assessment_frequency',
+    'recovery_time_objective',
+    'password_minimum_length',
+})
+
 # Facts Overview Functions (keeping unchanged from original)
+@st.cache_resource(show_spinner=False)
 def load_facts_data():
-    """Load the policy data"""
+    """Load the policy data (parsed once per process and shared read-only)"""
     factIndex_file = "factIndex.json"
     
     try:
         # Load JSON content
-        with open(factIndex_file, 'r', encoding='utf-8') as file:
-            factIndex_content = json.load(file)
+        with open(factIndex_file, 'rb') as file:
+            factIndex_content = orjson.loads(file.read())
         
-        return factIndex_content
+        return _normalize_facts(factIndex_content)
         
     except FileNotFoundError:
         # Fallback with the provided content if file not found
@@ -1223,16 +693,39 @@ def load_facts_data():
     # sample_data = json.load(open("factIndex.json"))
     # return sample_data
 
+@st.cache_data(show_spinner=False)
+def parse_uploaded_facts(raw: bytes) -> Dict:
+    """Parse an uploaded fact index JSON (cached per file contents)"""
+    return _normalize_facts(orjson.loads(raw))
+
+def _normalize_facts(data: Dict) -> Dict:
+    """Fill optional fact keys once at load so the render loops can subscript directly"""
+    for facts in data.values():
+        for fact in facts:
+            fact.setdefault('source_sentence', 'N/A')
+    return data
+
 def categorize_facts(data):
     """Categorize facts into consistent and inconsistent"""
-    inconsistent_keys = ['security_training_frequency', 'information_security_risk_assessment_frequency', 
-                        'recovery_time_objective', 'password_minimum_length']
+    inconsistent_facts = {}
+    consistent_facts = {}
     
-    inconsistent_facts = {k: v for k, v in data.items() if k in inconsistent_keys and len(v) > 1}
-    consistent_facts = {k: v for k, v in data.items() if k not in inconsistent_keys or len(v) == 1}
+    # Partition the fields in a single pass over the data
+    for field_name, facts in data.items():
+        checked = field_name in _INCONSISTENT_KEYS
+        if checked and len(facts) > 1:
+            inconsistent_facts[field_name] = facts
+        elif not checked or len(facts) == 1:
+            consistent_facts[field_name] = facts
     
     return inconsistent_facts, consistent_facts
 
+@st.cache_data(show_spinner=False)
+def load_facts_counts() -> tuple:
+    """Count inconsistent and consistent fields in the bundled policy data (computed once)"""
+    inconsistent_facts, consistent_facts = categorize_facts(load_facts_data())
+    return len(inconsistent_facts), len(consistent_facts)
+
 def search_sentence_in_document(sentence, document_content, context_chars=200):
     """Search for a sentence in document content and return context"""
     if not sentence or not document_content:
@@ -1387,64 +880,37 @@ Annual compliance reviews are performed for high-risk vendors with security docu
         }
     }
 
-# Modified function to load policy documents from individual files
+class PolicyDocument(NamedTuple):
+    """Metadata of one policy source document shipped next to the app"""
+    filename: str
+    title: str
+    type: str
+    last_updated: str
+    version: str
+
+# Policy source documents, built once; the file name is the id used by factIndex.json
+POLICY_DOCUMENTS = (
+    PolicyDocument("access_management_policy.md", "Access Management Policy", "Policy Document", "2024-03-15", "2.1"),
+    PolicyDocument("antivirus_management_procedure.md", "Antivirus Management Procedure", "Procedure Document", "2024-02-20", "1.0"),
+    PolicyDocument("data_management_policy.md", "Data Management Policy", "Policy Document", "2024-01-10", "1.2"),
+    PolicyDocument("disaster_recovery_plan.md", "Disaster Recovery Plan", "Operational Plan", "2024-04-05", "3.0"),
+    PolicyDocument("encryption_management.md", "Encryption Management Procedure", "Procedure Document", "2024-03-01", "4.0"),
+    PolicyDocument("information_security_policy.md", "Information Security Policy", "Policy Document", "2024-02-15", "1.0"),
+    PolicyDocument("risk_management_assessment_and_treatment_policy.md", "Risk Management Assessment and Treatment Policy", "Risk Management Policy", "2024-01-25", "2.0"),
+    PolicyDocument("vendor_management_policy.md", "Vendor Management Policy", "Risk Management Policy", "2024-03-20", "1.8"),
+)
+
+@st.cache_data(show_spinner=False)
+def read_policy_document(file_path: str) -> str:
+    """Read a policy markdown file once; later reruns reuse the text"""
+    with open(file_path, 'r', encoding='utf-8') as file:
+        return file.read()
+
 # Modified function to load policy documents from individual files
 def load_policy_source_documents_from_files():
     """Load policy documents from individual markdown files in the policies/ directory"""
     import os
     
-    # Define the policy files mapping
-    policy_files = {
-        "access_management_policy.md": {
-            "title": "Access Management Policy",
-            "type": "Policy Document",
-            "last_updated": "2024-03-15",
-            "version": "2.1"
-        },
-        "antivirus_management_procedure.md": {
-            "title": "Antivirus Management Procedure", 
-            "type": "Procedure Document",
-            "last_updated": "2024-02-20",
-            "version": "1.0"
-        },
-        "data_management_policy.md": {
-            "title": "Data Management Policy",
-            "type": "Policy Document", 
-            "last_updated": "2024-01-10",
-            "version": "1.2"
-        },
-        "disaster_recovery_plan.md": {
-            "title": "Disaster Recovery Plan",
-            "type": "Operational Plan",
-            "last_updated": "2024-04-05", 
-            "version": "3.0"
-        },
-        "encryption_management.md": {
-            "title": "Encryption Management Procedure",
-            "type": "Procedure Document",
-            "last_updated": "2024-03-01",
-            "version": "4.0"
-        },
-        "information_security_policy.md": {
-            "title": "Information Security Policy",
-            "type": "Policy Document",
-            "last_updated": "2024-02-15",
-            "version": "1.0"
-        },
-        "risk_management_assessment_and_treatment_policy.md": {
-            "title": "Risk Management Assessment and Treatment Policy",
-            "type": "Risk Management Policy",
-            "last_updated": "2024-01-25",
-            "version": "2.0"
-        },
-        "vendor_management_policy.md": {
-            "title": "Vendor Management Policy",
-            "type": "Risk Management Policy",
-            "last_updated": "2024-03-20",
-            "version": "1.8"
-        }
-    }
-    
     policies_directory = ""
     loaded_policies = {}
     
@@ -1454,242 +920,298 @@ def load_policy_source_documents_from_files():
     #     return load_mindmap_policy_source_documents()  # Fallback to embedded data
     
     # Load each policy file
-    for filename, metadata in policy_files.items():
+    for metadata in POLICY_DOCUMENTS:
+        filename = metadata.filename
         file_path = os.path.join(policies_directory, filename)
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+            content = read_policy_document(file_path)
                 
             loaded_policies[filename] = {
-                "title": metadata["title"],
+                "title": metadata.title,
                 "content": content,
-                "type": metadata["type"],
-                "last_updated": metadata["last_updated"],
-                "version": metadata["version"]
+                "type": metadata.type,
+                "last_updated": metadata.last_updated,
+                "version": metadata.version
             }
             
         except FileNotFoundError:
             st.warning(f"Policy file '{filename}' not found in '{policies_directory}' directory.")
             # Use fallback content for missing files
             loaded_policies[filename] = {
-                "title": metadata["title"],
-                "content": f"Content for {metadata['title']} not found. Please ensure the file {filename} exists in the {policies_directory} directory.",
-                "type": metadata["type"],
-                "last_updated": metadata["last_updated"],
-                "version": metadata["version"]
+                "title": metadata.title,
+                "content": f"Content for {metadata.title} not found. Please ensure the file {filename} exists in the {policies_directory} directory.",
+                "type": metadata.type,
+                "last_updated": metadata.last_updated,
+                "version": metadata.version
             }
             
         except Exception as e:
             st.error(f"Error loading policy file '{filename}': {str(e)}")
             loaded_policies[filename] = {
-                "title": metadata["title"],
+                "title": metadata.title,
                 "content": f"Error loading content: {str(e)}",
-                "type": metadata["type"],
-                "last_updated": metadata["last_updated"],
-                "version": metadata["version"]
+                "type": metadata.type,
+                "last_updated": metadata.last_updated,
+                "version": metadata.version
             }
     
     return loaded_policies
 
 # Updated show_facts_overview_popup function to use file-based loading
+# Enhanced Facts Overview CSS with two-panel layout (built once at import)
+_FACTS_OVERVIEW_CSS = """
+<style>
+    
+    .facts-main-content {
+        flex: 2;
+        overflow-y: auto;
+        padding-right: 1rem;
+    }
+    
+    .facts-source-panel {
+        flex: 1;
+        background: white;
+        border: 2px solid #e0e0e0;
+        border-radius: 12px;
+        padding: 1rem;
+        overflow-y: auto;
+        max-width: 400px;
+        height: fit-content;
+        max-height: 100%;
+    }
+    
+    .facts-source-header {
+        background: #f8f9fa;
+        padding: 0.75rem 1rem;
+        border-radius: 8px;
+        margin-bottom: 1rem;
+        border-left: 4px solid #2a5298;
+    }
+    
+    .policy-content-preview {
+        background: #f8f9fa;
+        padding: 0.75rem;
+        border-radius: 6px;
+        font-size: 0.85rem;
+        line-height: 1.4;
+        border-left: 3px solid #2a5298;
+        max-height: 200px;
+        overflow-y: auto;
+        white-space: pre-wrap;
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    }
+    
+    .facts-source-doc-item {
+        background: white;
+        border: 1px solid #e0e0e0;
+        border-radius: 8px;
+        margin-bottom: 1rem;
+        overflow: hidden;
+        transition: all 0.3s ease;
+    }
+    
+    .facts-source-doc-item:hover {
+        border-color: #2a5298;
+        box-shadow: 0 2px 8px rgba(42, 82, 152, 0.15);
+    }
+    
+    .inconsistent-metric {
+        background-color: #ffebee;
+        border: 2px solid #f44336;
+        border-radius: 10px;
+        padding: 10px;
+        margin: 5px 0;
+    }
+    .consistent-metric {
+        background-color: #e8f5e8;
+        border: 2px solid #4caf50;
+        border-radius: 10px;
+        padding: 10px;
+        margin: 5px 0;
+    }
+    .warning-box {
+        background-color: #fff3cd;
+        border: 1px solid #ffeaa7;
+        border-radius: 5px;
+        padding: 15px;
+        margin: 10px 0;
+    }
+    .info-box {
+        background-color: #e3f2fd;
+        border: 1px solid #90caf9;
+        border-radius: 5px;
+        padding: 15px;
+        margin: 10px 0;
+    }
+    .doc-badge {
+        display: inline-block;
+        padding: 3px 8px;
+        margin: 2px;
+        background-color: #e1f5fe;
+        border-radius: 15px;
+        font-size: 12px;
+        border: 1px solid #0277bd;
+    }
+    
+    /* NEW: Clickable source sentence styling */
+    .clickable-sentence {
+        background: linear-gradient(120deg, #a8e6cf 0%, #dcedc1 100%);
+        border: 1px solid #4caf50;
+        border-radius: 6px;
+        padding: 8px 12px;
+        margin: 4px 0;
+        cursor: pointer;
+        transition: all 0.3s ease;
+        position: relative;
+        display: inline-block;
+        max-width: 100%;
+        word-wrap: break-word;
+    }
+    
+    .clickable-sentence:hover {
+        background: linear-gradient(120deg, #4caf50 0%, #8bc34a 100%);
+        color: white;
+        transform: translateY(-1px);
+        box-shadow: 0 4px 8px rgba(76, 175, 80, 0.3);
+    }
+    
+    .clickable-sentence::after {
+        content: "🔍";
+        position: absolute;
+        right: 8px;
+        top: 50%;
+        transform: translateY(-50%);
+        opacity: 0;
+        transition: opacity 0.3s ease;
+    }
+    
+    .clickable-sentence:hover::after {
+        opacity: 1;
+    }
+    
+    .sentence-search-result {
+        background: #fff3cd;
+        border: 2px solid #ffc107;
+        border-radius: 8px;
+        padding: 1rem;
+        margin: 1rem 0;
+        position: relative;
+    }
+    
+    .sentence-search-result::before {
+        content: "📍";
+        position: absolute;
+        top: -10px;
+        left: 20px;
+        background: white;
+        padding: 0 8px;
+        font-size: 1.2rem;
+    }
+    
+    .highlighted-sentence {
+        background: #ffeb3b;
+        padding: 2px 4px;
+        border-radius: 3px;
+        font-weight: bold;
+    }
+    
+    .search-context {
+        background: #f8f9fa;
+        padding: 0.5rem;
+        border-radius: 4px;
+        margin-top: 0.5rem;
+        font-size: 0.9rem;
+        color: #666;
+    }
+    .fact-metric {
+        background-color: #f5f5f5;
+        border: 2px solid #9e9e9e;
+        border-radius: 10px;
+        padding: 10px;
+        margin: 5px 0;
+    }
+    .metrics-row {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 1rem;
+        margin-bottom: 1rem;
+    }
+    .overview-metric-label {
+        font-size: 14px;
+        color: #555;
+    }
+    .overview-metric-value {
+        font-size: 2rem;
+        font-weight: bold;
+    }
+    .overview-metric-delta {
+        font-size: 14px;
+    }
+</style>
+"""
+
+@st.cache_data(show_spinner=False)
+def _render_metrics_html(total: int, inconsistent: int, consistent: int, rate: float) -> str:
+    """Render the four overview metric cards as a single HTML row"""
+    return f"""
+    <div class="metrics-row">
+        <div class="fact-metric" title="Total number of objective facts analyzed">
+            <div class="overview-metric-label">📋 Total Objective Facts</div>
+            <div class="overview-metric-value">{total}</div>
+        </div>
+        <div class="inconsistent-metric" title="Fields with conflicting values across documents">
+            <div class="overview-metric-label">⚠️ Inconsistent Facts</div>
+            <div class="overview-metric-value">{inconsistent}</div>
+            <div class="overview-metric-delta" style="color: #4caf50;">↓ -{inconsistent} conflicts</div>
+        </div>
+        <div class="consistent-metric" title="Fields with consistent values across documents">
+            <div class="overview-metric-label">✅ Consistent Facts</div>
+            <div class="overview-metric-value">{consistent}</div>
+            <div class="overview-metric-delta" style="color: #4caf50;">↑ +{consistent} aligned</div>
+        </div>
+        <div class="fact-metric" title="Percentage of consistent policy fields">
+            <div class="overview-metric-label">📈 Consistency Rate</div>
+            <div class="overview-metric-value">{rate:.1f}%</div>
+        </div>
+    </div>
+    """
+
+# Source document link button CSS (built once at import)
+_DOCUMENT_LINK_CSS = """
+<style>
+    .document-link-button {
+        display: inline-flex;
+        align-items: center;
+        gap: 0.5rem;
+        padding: 0.5rem 1rem;
+        background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
+        color: white !important;
+        text-decoration: none !important;
+        border-radius: 6px;
+        font-size: 0.85rem;
+        font-weight: 500;
+        border: none;
+        cursor: pointer;
+        transition: all 0.3s ease;
+    }
+    
+    .document-link-button:hover {
+        background: linear-gradient(135deg, #2a5298 0%, #3d5998 100%);
+        transform: translateY(-1px);
+        box-shadow: 0 4px 8px rgba(42, 82, 152, 0.4);
+    }
+</style>
+"""
+
 def show_facts_overview_popup_with_files():
     """Display Facts Overview popup with source documents loaded from files"""
     
     # Enhanced Facts Overview CSS with two-panel layout
-    st.markdown("""
-    <style>
-        
-        .facts-main-content {
-            flex: 2;
-            overflow-y: auto;
-            padding-right: 1rem;
-        }
-        
-        .facts-source-panel {
-            flex: 1;
-            background: white;
-            border: 2px solid #e0e0e0;
-            border-radius: 12px;
-            padding: 1rem;
-            overflow-y: auto;
-            max-width: 400px;
-            height: fit-content;
-            max-height: 100%;
-        }
-        
-        .facts-source-header {
-            background: #f8f9fa;
-            padding: 0.75rem 1rem;
-            border-radius: 8px;
-            margin-bottom: 1rem;
-            border-left: 4px solid #2a5298;
-        }
-        
-        .policy-content-preview {
-            background: #f8f9fa;
-            padding: 0.75rem;
-            border-radius: 6px;
-            font-size: 0.85rem;
-            line-height: 1.4;
-            border-left: 3px solid #2a5298;
-            max-height: 200px;
-            overflow-y: auto;
-            white-space: pre-wrap;
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-        }
-        
-        .facts-source-doc-item {
-            background: white;
-            border: 1px solid #e0e0e0;
-            border-radius: 8px;
-            margin-bottom: 1rem;
-            overflow: hidden;
-            transition: all 0.3s ease;
-        }
-        
-        .facts-source-doc-item:hover {
-            border-color: #2a5298;
-            box-shadow: 0 2px 8px rgba(42, 82, 152, 0.15);
-        }
-        
-        .inconsistent-metric {
-            background-color: #ffebee;
-            border: 2px solid #f44336;
-            border-radius: 10px;
-            padding: 10px;
-            margin: 5px 0;
-        }
-        .consistent-metric {
-            background-color: #e8f5e8;
-            border: 2px solid #4caf50;
-            border-radius: 10px;
-            padding: 10px;
-            margin: 5px 0;
-        }
-        .warning-box {
-            background-color: #fff3cd;
-            border: 1px solid #ffeaa7;
-            border-radius: 5px;
-            padding: 15px;
-            margin: 10px 0;
-        }
-        .info-box {
-            background-color: #e3f2fd;
-            border: 1px solid #90caf9;
-            border-radius: 5px;
-            padding: 15px;
-            margin: 10px 0;
-        }
-        .doc-badge {
-            display: inline-block;
-            padding: 3px 8px;
-            margin: 2px;
-            background-color: #e1f5fe;
-            border-radius: 15px;
-            font-size: 12px;
-            border: 1px solid #0277bd;
-        }
-        
-        /* NEW: Clickable source sentence styling */
-        .clickable-sentence {
-            background: linear-gradient(120deg, #a8e6cf 0%, #dcedc1 100%);
-            border: 1px solid #4caf50;
-            border-radius: 6px;
-            padding: 8px 12px;
-            margin: 4px 0;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            position: relative;
-            display: inline-block;
-            max-width: 100%;
-            word-wrap: break-word;
-        }
-        
-        .clickable-sentence:hover {
-            background: linear-gradient(120deg, #4caf50 0%, #8bc34a 100%);
-            color: white;
-            transform: translateY(-1px);
-            box-shadow: 0 4px 8px rgba(76, 175, 80, 0.3);
-        }
-        
-        .clickable-sentence::after {
-            content: "🔍";
-            position: absolute;
-            right: 8px;
-            top: 50%;
-            transform: translateY(-50%);
-            opacity: 0;
-            transition: opacity 0.3s ease;
-        }
-        
-        .clickable-sentence:hover::after {
-            opacity: 1;
-        }
-        
-        .sentence-search-result {
-            background: #fff3cd;
-            border: 2px solid #ffc107;
-            border-radius: 8px;
-            padding: 1rem;
-            margin: 1rem 0;
-            position: relative;
-        }
-        
-        .sentence-search-result::before {
-            content: "📍";
-            position: absolute;
-            top: -10px;
-            left: 20px;
-            background: white;
-            padding: 0 8px;
-            font-size: 1.2rem;
-        }
-        
-        .highlighted-sentence {
-            background: #ffeb3b;
-            padding: 2px 4px;
-            border-radius: 3px;
-            font-weight: bold;
-        }
-        
-        .search-context {
-            background: #f8f9fa;
-            padding: 0.5rem;
-            border-radius: 4px;
-            margin-top: 0.5rem;
-            font-size: 0.9rem;
-            color: #666;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    st.html(_FACTS_OVERVIEW_CSS)
 
-    # Add this CSS to your existing styles
-    st.markdown("""
-        <style>
-            .document-link-button {
-                display: inline-flex;
-                align-items: center;
-                gap: 0.5rem;
-                padding: 0.5rem 1rem;
-                background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
-                color: white !important;
-                text-decoration: none !important;
-                border-radius: 6px;
-                font-size: 0.85rem;
-                font-weight: 500;
-                border: none;
-                cursor: pointer;
-                transition: all 0.3s ease;
-            }
-            
-            .document-link-button:hover {
-                background: linear-gradient(135deg, #2a5298 0%, #3d5998 100%);
-                transform: translateY(-1px);
-                box-shadow: 0 4px 8px rgba(42, 82, 152, 0.4);
-            }
-        </style>
-        """, unsafe_allow_html=True)
+    # Source document link buttons
+    st.html(_DOCUMENT_LINK_CSS)
     
     # Header
     st.title("🔍 Policy Document Inconsistency Analyzer")
@@ -1699,6 +1221,11 @@ def show_facts_overview_popup_with_files():
     data = load_facts_data()
     inconsistent_facts, consistent_facts = categorize_facts(data)
     source_docs = load_policy_source_documents_from_files()
+    # Export cache key: the fact index file's mtime, or the uploaded bytes below
+    try:
+        facts_key = os.path.getmtime("factIndex.json")
+    except OSError:
+        facts_key = None
     
     # Create main layout
     st.markdown('<div class="facts-modal-body">', unsafe_allow_html=True)
@@ -1715,44 +1242,21 @@ def show_facts_overview_popup_with_files():
         # File upload option
         uploaded_file = st.sidebar.file_uploader("Upload JSON Data", type=['json'])
         if uploaded_file is not None:
-            data = json.load(uploaded_file)
+            facts_key = uploaded_file.getvalue()
+            data = parse_uploaded_facts(facts_key)
             inconsistent_facts, consistent_facts = categorize_facts(data)
         
-        # Overview metrics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                label="📋 Total Objective Facts", 
-                value=len(data),
-                help="Total number of objective facts analyzed"
-            )
-        
-        with col2:
-            st.metric(
-                label="⚠️ Inconsistent Facts", 
-                value=len(inconsistent_facts),
-                delta=f"-{len(inconsistent_facts)} conflicts",
-                delta_color="inverse",
-                help="Fields with conflicting values across documents"
-            )
+        # Overview metrics (counts computed once for all four cards)
+        total_facts = len(data)
+        inconsistent_count = len(inconsistent_facts)
+        consistent_count = len(consistent_facts)
+        consistency_rate = (consistent_count / total_facts * 100.0) if total_facts else 0.0
         
-        with col3:
-            st.metric(
-                label="✅ Consistent Facts", 
-                value=len(consistent_facts),
-                delta=f"+{len(consistent_facts)} aligned",
-                delta_color="normal",
-                help="Fields with consistent values across documents"
-            )
+        # Display title for each policy field, built once instead of in every tab loop
+        field_titles = {field_name: field_name.replace('_', ' ').title() for field_name in data}
         
-        with col4:
-            consistency_rate = (len(consistent_facts) / len(data)) * 100 if data else 0
-            st.metric(
-                label="📈 Consistency Rate", 
-                value=f"{consistency_rate:.1f}%",
-                help="Percentage of consistent policy fields"
-            )
+        # All four cards in one element
+        st.html(_render_metrics_html(total_facts, inconsistent_count, consistent_count, consistency_rate))
         
         # Main content tabs (same as before)
         tab1, tab2, tab3 = st.tabs(["📋 All Facts", "🚨 Inconsistencies", "✅ Consistent Facts"])
@@ -1772,14 +1276,14 @@ def show_facts_overview_popup_with_files():
                 
                 # Display all facts with clickable source sentences
                 for idx, (field_name, facts) in enumerate(data.items(), 1):
-                    status = "Inconsistent" if len(facts) > 1 and field_name in ['security_training_frequency', 'information_security_risk_assessment_frequency', 'recovery_time_objective', 'password_minimum_length'] else "Consistent"
+                    status = "Inconsistent" if field_name in inconsistent_facts else "Consistent"
                     status_emoji = "⚠️" if status == "Inconsistent" else "✅"
                     
                     fact_name = facts[0]["fact_name"]
                     if not fact_name:
-                        fact_name = field_name.replace('_', ' ').title()
+                        fact_name = field_titles[field_name]
                     
-                    with st.expander(f"{status_emoji} {field_name.replace('_', ' ').title()} ({len(facts)} fact{'s' if len(facts) > 1 else ''})", expanded=False):
+                    with st.expander(f"{status_emoji} {field_titles[field_name]} ({len(facts)} fact{'s' if len(facts) > 1 else ''})", expanded=False):
                         st.markdown(f"**Policy Field:** `{fact_name}`")
                         st.markdown(f"**Status:** {status}")
                         
@@ -1794,7 +1298,7 @@ def show_facts_overview_popup_with_files():
                                 st.markdown(f"**Document:** {fact['document_title']}")
                             
                             with col3:
-                                source_sentence = fact.get("source_sentence", "N/A")
+                                source_sentence = fact["source_sentence"]
                                 print(source_sentence)
                                 if source_sentence != "N/A":
                                     # Create clickable sentence
@@ -1809,12 +1313,8 @@ def show_facts_overview_popup_with_files():
                                         source_docs = load_policy_source_documents_from_files()
                                         doc_title = fact['document_title']
                                         
-                                        # Find the matching document
-                                        matching_doc = None
-                                        for filename, doc_info in source_docs.items():
-                                            if filename == doc_title:
-                                                matching_doc = doc_info
-                                                break
+                                        # Find the matching document (keyed by file name)
+                                        matching_doc = source_docs.get(doc_title)
                                         # print(matching_doc)
                                         if matching_doc:
                                             found, context, position = search_sentence_in_document(
@@ -1899,8 +1399,10 @@ def show_facts_overview_popup_with_files():
                 # Session state for sentence search is initialized in main()
                 
                 for idx, (field_name, facts) in enumerate(inconsistent_facts.items(), 1):
-                    with st.expander(f"🔴 {field_name.replace('_', ' ').title()} ({len(facts)} conflicts)", expanded=True):
-                        display_fact_name = facts[0]['fact_name'] if len(set(fact['fact_name'] for fact in facts)) == 1 else field_name.replace('_', ' ').title()
+                    with st.expander(f"🔴 {field_titles[field_name]} ({len(facts)} conflicts)", expanded=True):
+                        first_fact_name = facts[0]['fact_name']
+                        all_same = all(fact['fact_name'] == first_fact_name for fact in facts)
+                        display_fact_name = first_fact_name if all_same else field_titles[field_name]
                         st.markdown(f"**Policy Field:** {display_fact_name}")
                         
                         # Display facts with clickable source sentences
@@ -1914,7 +1416,7 @@ def show_facts_overview_popup_with_files():
                                 st.markdown(f"**Document:** {fact['document_title']}")
                             
                             with col3:
-                                source_sentence = fact.get("source_sentence", "N/A")
+                                source_sentence = fact["source_sentence"]
                                 if source_sentence != "N/A":
                                     # Create clickable sentence
                                     sentence_key = f"search_{field_name}_{fact_idx}_{hash(source_sentence) % 10000}"
@@ -1928,12 +1430,8 @@ def show_facts_overview_popup_with_files():
                                         source_docs = load_policy_source_documents_from_files()
                                         doc_title = fact['document_title']
                                         
-                                        # Find the matching document
-                                        matching_doc = None
-                                        for filename, doc_info in source_docs.items():
-                                            if filename == doc_title:
-                                                matching_doc = doc_info
-                                                break
+                                        # Find the matching document (keyed by file name)
+                                        matching_doc = source_docs.get(doc_title)
                                         
                                         if matching_doc:
                                             found, context, position = search_sentence_in_document(
@@ -2016,9 +1514,9 @@ def show_facts_overview_popup_with_files():
                     with col1:
                         st.markdown(f"""
                         <div class="consistent-metric">
-                            <h4>{field_name.replace('_', ' ').title()}</h4>
+                            <h4>{field_titles[field_name]}</h4>
                             <p><strong>Value:</strong> {fact['value']}</p>
-                            <p><strong>Source Sentence:</strong> "{fact.get('source_sentence', 'N/A')[:100]}{'...' if len(fact.get('source_sentence', '')) > 100 else ''}"</p>
+                            <p><strong>Source Sentence:</strong> "{fact['source_sentence'][:100]}{'...' if len(fact['source_sentence']) > 100 else ''}"</p>
                             <span class="doc-badge">{fact['document_title']}</span>
                         </div>
                         """, unsafe_allow_html=True)
@@ -2073,24 +1571,24 @@ def show_facts_overview_popup_with_files():
         col1, col2 = st.columns(2)
         
         with col1:
-            if st.button("📄 Export Policies", use_container_width=True):
-                st.download_button(
-                    "📥 Download JSON",
-                    json.dumps(source_docs, indent=2),
-                    f"policy_sources_{uuid.uuid4().hex[:8]}.json",
-                    "application/json",
-                    use_container_width=True
-                )
+            payload = source_documents_to_json(source_docs)
+            st.download_button(
+                "📄 Export Policies",
+                payload,
+                f"policy_sources_{content_suffix(payload)}.json",
+                "application/json",
+                use_container_width=True
+            )
         
         with col2:
-            if st.button("📊 Export Facts", use_container_width=True):
-                st.download_button(
-                    "📥 Download JSON",
-                    json.dumps(data, indent=2),
-                    f"facts_data_{uuid.uuid4().hex[:8]}.json",
-                    "application/json",
-                    use_container_width=True
-                )
+            payload = facts_data_to_json(facts_key, data)
+            st.download_button(
+                "📊 Export Facts",
+                payload,
+                f"facts_data_{content_suffix(payload)}.json",
+                "application/json",
+                use_container_width=True
+            )
         
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -2176,20 +1674,20 @@ def create_demo_landing_page():
                 use_container_width=True,
                 help="Launch interactive visualization of TechCorp's policy framework"
             ):
-                with st.spinner("Loading TechCorp policy analysis..."):
-                    try:
-                        markdown_content, audit_data = generate_audit_mindmap()
-                        if markdown_content:
-                            st.session_state.mindmap_generated = True
-                            st.session_state.mindmap_content = markdown_content
-                            st.session_state.mindmap_data = audit_data
-                            st.session_state.show_fullscreen = True
-                            st.success("✅ Mind map ready! Opening full analysis...")
-                            st.rerun()
-                        else:
-                            st.error("❌ Demo data loading failed")
-                    except Exception as e:
-                        st.error(f"❌ Error loading demo: {str(e)}")
+                try:
+                    markdown_content, audit_data, mindmap_stats = generate_audit_mindmap()
+                    if markdown_content:
+                        st.session_state.mindmap_generated = True
+                        st.session_state.mindmap_content = markdown_content
+                        st.session_state.mindmap_data = audit_data
+                        st.session_state.mindmap_stats = mindmap_stats
+                        st.session_state.show_fullscreen = True
+                        st.success("✅ Mind map ready! Opening full analysis...")
+                        st.rerun()
+                    else:
+                        st.error("❌ Demo data loading failed")
+                except Exception as e:
+                    st.error(f"❌ Error loading demo: {str(e)}")
             
             # Quick metrics
             metric_col1, metric_col2 = st.columns(2)
@@ -2237,14 +1735,13 @@ def create_demo_landing_page():
             
             # Load and display metrics
             try:
-                facts_data = load_facts_data()
-                inconsistent_facts, consistent_facts = categorize_facts(facts_data)
+                issues_found, aligned_policies = load_facts_counts()
                 
                 metric_col1, metric_col2 = st.columns(2)
                 with metric_col1:
-                    st.metric("Issues Found", len(inconsistent_facts), delta=None, delta_color="inverse")
+                    st.metric("Issues Found", issues_found, delta=None, delta_color="inverse")
                 with metric_col2:
-                    st.metric("Aligned Policies", len(consistent_facts), delta=None, delta_color="normal")
+                    st.metric("Aligned Policies", aligned_policies, delta=None, delta_color="normal")
             except Exception as e:
                 # Fallback metrics
                 metric_col1, metric_col2 = st.columns(2)
@@ -2278,220 +1775,223 @@ def create_demo_landing_page():
 
 
 
+# Demo presentation CSS (built once at import)
+_DEMO_CSS = """
+<style>
+.demo-header {
+    background: linear-gradient(135deg, #1e3c72 0%, #2a5298 50%, #3d5998 100%);
+    color: white;
+    padding: 2rem;
+    border-radius: 15px;
+    margin-bottom: 2rem;
+    text-align: center;
+    box-shadow: 0 8px 25px rgba(42, 82, 152, 0.3);
+}
+
+.demo-subtitle {
+    font-size: 1.2rem;
+    margin: 1rem 0;
+    opacity: 0.9;
+}
+
+.demo-stats {
+    display: flex;
+    justify-content: center;
+    gap: 3rem;
+    margin-top: 1.5rem;
+}
+
+.demo-stat {
+    text-align: center;
+    background: rgba(255,255,255,0.1);
+    padding: 1rem;
+    border-radius: 10px;
+    backdrop-filter: blur(10px);
+}
+
+.demo-stat .stat-number {
+    display: block;
+    font-size: 2rem;
+    font-weight: bold;
+    color: #fff;
+}
+
+.demo-stat .stat-label {
+    font-size: 0.9rem;
+    opacity: 0.8;
+}
+
+.demo-scenario {
+    background: #e3f2fd;
+    border: 1px solid #2196f3;
+    border-radius: 10px;
+    padding: 1.5rem;
+    margin-bottom: 2rem;
+}
+
+.demo-scenario h3 {
+    color: #1565c0;
+    margin-top: 0;
+}
+
+.demo-feature-card {
+    background: white;
+    border: 2px solid #e0e0e0;
+    border-radius: 12px;
+    padding: 1.5rem;
+    height: 100%;
+    box-shadow: 0 4px 12px rgba(0,0,0,0.1);
+    transition: all 0.3s ease;
+}
+
+.demo-feature-card:hover {
+    border-color: #2a5298;
+    box-shadow: 0 6px 20px rgba(42, 82, 152, 0.15);
+    transform: translateY(-2px);
+}
+
+.feature-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 1rem;
+    padding-bottom: 1rem;
+    border-bottom: 2px solid #f0f0f0;
+}
+
+.feature-header h2 {
+    margin: 0;
+    color: #1e3c72;
+    font-size: 1.4rem;
+}
+
+.feature-badge {
+    background: #ff4757;
+    color: white;
+    padding: 0.3rem 0.8rem;
+    border-radius: 20px;
+    font-size: 0.8rem;
+    font-weight: bold;
+}
+
+.feature-description ul {
+    margin: 1rem 0;
+    padding-left: 1.2rem;
+}
+
+.feature-description li {
+    margin: 0.5rem 0;
+    color: #333;
+}
+
+.demo-preview {
+    background: #f8f9fa;
+    border-left: 4px solid #2a5298;
+    padding: 1rem;
+    margin: 1rem 0;
+    border-radius: 0 8px 8px 0;
+}
+
+.demo-preview.alert-style {
+    background: #fff3cd;
+    border-left-color: #ffc107;
+}
+
+.quick-metrics {
+    display: flex;
+    justify-content: space-around;
+    margin-top: 1rem;
+    padding: 1rem;
+    background: #f8f9fa;
+    border-radius: 8px;
+}
+
+.quick-metrics.alert-border {
+    border: 1px solid #ffc107;
+}
+
+.metric-item {
+    text-align: center;
+}
+
+.metric-item.inconsistent .metric-value {
+    color: #dc3545;
+}
+
+.metric-item.consistent .metric-value {
+    color: #28a745;
+}
+
+.metric-value {
+    display: block;
+    font-size: 1.8rem;
+    font-weight: bold;
+    color: #2a5298;
+}
+
+.metric-name {
+    font-size: 0.9rem;
+    color: #666;
+}
+
+.demo-guidance {
+    background: #fff;
+    border: 2px solid #28a745;
+    border-radius: 12px;
+    padding: 1.5rem;
+    margin-top: 2rem;
+}
+
+.demo-guidance h3 {
+    color: #155724;
+    margin-top: 0;
+}
+
+.demo-steps {
+    display: flex;
+    gap: 1rem;
+    flex-wrap: wrap;
+}
+
+.step-item {
+    flex: 1;
+    min-width: 200px;
+    display: flex;
+    align-items: flex-start;
+    gap: 1rem;
+    background: #f8f9fa;
+    padding: 1rem;
+    border-radius: 8px;
+}
+
+.step-number {
+    background: #28a745;
+    color: white;
+    width: 30px;
+    height: 30px;
+    border-radius: 50%;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    font-weight: bold;
+    flex-shrink: 0;
+}
+
+.step-content strong {
+    color: #155724;
+}
+
+.step-content p {
+    margin: 0.5rem 0 0 0;
+    font-size: 0.9rem;
+    color: #666;
+}
+</style>
+"""
+
 def add_demo_css():
     """Enhanced CSS styling for demo presentation"""
-    st.markdown("""
-    <style>
-    .demo-header {
-        background: linear-gradient(135deg, #1e3c72 0%, #2a5298 50%, #3d5998 100%);
-        color: white;
-        padding: 2rem;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        text-align: center;
-        box-shadow: 0 8px 25px rgba(42, 82, 152, 0.3);
-    }
-    
-    .demo-subtitle {
-        font-size: 1.2rem;
-        margin: 1rem 0;
-        opacity: 0.9;
-    }
-    
-    .demo-stats {
-        display: flex;
-        justify-content: center;
-        gap: 3rem;
-        margin-top: 1.5rem;
-    }
-    
-    .demo-stat {
-        text-align: center;
-        background: rgba(255,255,255,0.1);
-        padding: 1rem;
-        border-radius: 10px;
-        backdrop-filter: blur(10px);
-    }
-    
-    .demo-stat .stat-number {
-        display: block;
-        font-size: 2rem;
-        font-weight: bold;
-        color: #fff;
-    }
-    
-    .demo-stat .stat-label {
-        font-size: 0.9rem;
-        opacity: 0.8;
-    }
-    
-    .demo-scenario {
-        background: #e3f2fd;
-        border: 1px solid #2196f3;
-        border-radius: 10px;
-        padding: 1.5rem;
-        margin-bottom: 2rem;
-    }
-    
-    .demo-scenario h3 {
-        color: #1565c0;
-        margin-top: 0;
-    }
-    
-    .demo-feature-card {
-        background: white;
-        border: 2px solid #e0e0e0;
-        border-radius: 12px;
-        padding: 1.5rem;
-        height: 100%;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-        transition: all 0.3s ease;
-    }
-    
-    .demo-feature-card:hover {
-        border-color: #2a5298;
-        box-shadow: 0 6px 20px rgba(42, 82, 152, 0.15);
-        transform: translateY(-2px);
-    }
-    
-    .feature-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 1rem;
-        padding-bottom: 1rem;
-        border-bottom: 2px solid #f0f0f0;
-    }
-    
-    .feature-header h2 {
-        margin: 0;
-        color: #1e3c72;
-        font-size: 1.4rem;
-    }
-    
-    .feature-badge {
-        background: #ff4757;
-        color: white;
-        padding: 0.3rem 0.8rem;
-        border-radius: 20px;
-        font-size: 0.8rem;
-        font-weight: bold;
-    }
-    
-    .feature-description ul {
-        margin: 1rem 0;
-        padding-left: 1.2rem;
-    }
-    
-    .feature-description li {
-        margin: 0.5rem 0;
-        color: #333;
-    }
-    
-    .demo-preview {
-        background: #f8f9fa;
-        border-left: 4px solid #2a5298;
-        padding: 1rem;
-        margin: 1rem 0;
-        border-radius: 0 8px 8px 0;
-    }
-    
-    .demo-preview.alert-style {
-        background: #fff3cd;
-        border-left-color: #ffc107;
-    }
-    
-    .quick-metrics {
-        display: flex;
-        justify-content: space-around;
-        margin-top: 1rem;
-        padding: 1rem;
-        background: #f8f9fa;
-        border-radius: 8px;
-    }
-    
-    .quick-metrics.alert-border {
-        border: 1px solid #ffc107;
-    }
-    
-    .metric-item {
-        text-align: center;
-    }
-    
-    .metric-item.inconsistent .metric-value {
-        color: #dc3545;
-    }
-    
-    .metric-item.consistent .metric-value {
-        color: #28a745;
-    }
-    
-    .metric-value {
-        display: block;
-        font-size: 1.8rem;
-        font-weight: bold;
-        color: #2a5298;
-    }
-    
-    .metric-name {
-        font-size: 0.9rem;
-        color: #666;
-    }
-    
-    .demo-guidance {
-        background: #fff;
-        border: 2px solid #28a745;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin-top: 2rem;
-    }
-    
-    .demo-guidance h3 {
-        color: #155724;
-        margin-top: 0;
-    }
-    
-    .demo-steps {
-        display: flex;
-        gap: 1rem;
-        flex-wrap: wrap;
-    }
-    
-    .step-item {
-        flex: 1;
-        min-width: 200px;
-        display: flex;
-        align-items: flex-start;
-        gap: 1rem;
-        background: #f8f9fa;
-        padding: 1rem;
-        border-radius: 8px;
-    }
-    
-    .step-number {
-        background: #28a745;
-        color: white;
-        width: 30px;
-        height: 30px;
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-weight: bold;
-        flex-shrink: 0;
-    }
-    
-    .step-content strong {
-        color: #155724;
-    }
-    
-    .step-content p {
-        margin: 0.5rem 0 0 0;
-        font-size: 0.9rem;
-        color: #666;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.html(_DEMO_CSS)
 
 # Update the main function to use the demo landing page
 def main():
@@ -2513,6 +2013,7 @@ def main():
         st.session_state.mindmap_generated = False
         st.session_state.mindmap_content = None
         st.session_state.mindmap_data = None
+        st.session_state.mindmap_stats = None
     
     if 'show_fullscreen' not in st.session_state:
         st.session_state.show_fullscreen = False
@@ -2526,7 +2027,11 @@ def main():
 
     # Handle modal states first
     if st.session_state.show_fullscreen and st.session_state.mindmap_content:
-        show_fullscreen_mindmap(st.session_state.mindmap_content, st.session_state.mindmap_data)
+        show_fullscreen_mindmap(
+            st.session_state.mindmap_content,
+            st.session_state.mindmap_data,
+            st.session_state.mindmap_stats
+        )
         return
     
     if st.session_state.show_facts_popup:
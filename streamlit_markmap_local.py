@@ -1,7 +1,10 @@
+from functools import lru_cache
+
 import streamlit.components.v1 as components
 
-def markmap(data, height=600):
-    data = str(data)
+@lru_cache(maxsize=8)
+def _markmap_html(data, height):
+    """Build the markmap iframe document (memoized per content and height)"""
     markdown_style = '''
         <style>
             .markmap {{
@@ -39,5 +42,9 @@ def markmap(data, height=600):
             </script>
         </div>
     '''
-    markmap_component = components.html(markdown_html, height=height)
-    return markmap_component
\ No newline at end of file
+    return markdown_html
+
+def markmap(data, height=600):
+    data = str(data)
+    markmap_component = components.html(_markmap_html(data, height), height=height)
+    return markmap_component